@@ -24,7 +24,7 @@ from PySide6.QtGui import QFont, QColor, QTextCursor, QTextCharFormat
 
 # Import from same directory (flat structure)
 import metamodel
-from nfr_queries import getEntity, getEntityName, getChildren, getDecompositionsFor, getClaimsFor
+from nfr_queries import getEntity, getEntityName, getChildren, getDecompositionsFor, getClaimsFor, getSoftgoalClass
 from classifier_v6 import classify_fr_nfr, classify_nfr_type, classify_fr_type
 from menu_llm import MenuLLM
 import ollama
@@ -1526,10 +1526,7 @@ class ChatInterface(QMainWindow):
                                         instance_children = []
                                         
                                         # Find corresponding Softgoal class for this Type
-                                        softgoal_name = name.replace('Type', 'Softgoal')
-                                        softgoal_class = None
-                                        if hasattr(metamodel, softgoal_name):
-                                            softgoal_class = getattr(metamodel, softgoal_name)
+                                        softgoal_class = getSoftgoalClass(obj)
                                         
                                         if softgoal_class:
                                             for inst_name, inst_obj in inspect.getmembers(metamodel):
@@ -1571,10 +1568,7 @@ class ChatInterface(QMainWindow):
                                         
                                         # Ground instances
                                         instance_children = []
-                                        softgoal_name = name.replace('Type', 'Softgoal')
-                                        softgoal_class = None
-                                        if hasattr(metamodel, softgoal_name):
-                                            softgoal_class = getattr(metamodel, softgoal_name)
+                                        softgoal_class = getSoftgoalClass(obj)
                                         
                                         if softgoal_class:
                                             for inst_name, inst_obj in inspect.getmembers(metamodel):
@@ -1613,10 +1607,7 @@ class ChatInterface(QMainWindow):
                                         
                                         instance_children = []
                                         # FR instances would be instances of FRSoftgoal, not FRType
-                                        softgoal_name = name.replace('Type', 'Softgoal')
-                                        softgoal_class = None
-                                        if hasattr(metamodel, softgoal_name):
-                                            softgoal_class = getattr(metamodel, softgoal_name)
+                                        softgoal_class = getSoftgoalClass(obj)
                                         
                                         if softgoal_class:
                                             for inst_name, inst_obj in inspect.getmembers(metamodel):
@@ -4,46 +4,32 @@ NFR Elicitation Assistant - Main Application
 Modern menu-based assistant for NFR Framework analysis
 """
 
+import os
 import sys
-import threading
+import functools
+import logging
+from collections import namedtuple
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QGridLayout, QPushButton, QLabel, QFrame
+    QGridLayout, QPushButton, QLabel, QSizePolicy
 )
-from PySide6.QtCore import Qt, QSize, Signal, QObject
-from PySide6.QtGui import QFont, QIcon, QPalette, QColor, QPixmap
+from PySide6.QtCore import Qt, QSize, QRectF, Signal, QObject, QRunnable, QThreadPool, QTimer
+from PySide6.QtGui import QFont, QFontMetrics, QPalette, QColor, QPixmap, QPainter, QPen, QBrush
 
 # Import from same directory (flat structure)
+# Menu windows, the classifier and ollama are imported lazily (background
+# loader / open_* callbacks) to keep them off the path to the first paint
 import metamodel
-from nfr_queries import getEntity
-from classifier_v6 import classify_fr_nfr, classify_nfr_type, classify_fr_type
-from menu_llm import MenuLLM
-import ollama
-from utils import format_entity_name
-
-# Import menu windows
-from menu_windows import (
-    InfoWindow,
-    ClassificationWindow,
-    DecompositionWindow,
-    AttributionWindow,
-    ExamplesWindow,
-    NFRTypesWindow,
-    OperationalizingSoftgoalsWindow,
-    ClaimSoftgoalsWindow,
-    SideEffectsWindow,
-    WhatsThisWindow,
-    OperationalizationDecompositionWindow,
-    VerificationWindow,
-    ChatWindow,
-)
+
+log = logging.getLogger(__name__)
+
 # ============================================================================
 # BACKGROUND LLM LOADER
 # ============================================================================
 
 class BackgroundLLMLoader(QObject):
-    """Load LLM, metamodel, and classifier in background thread on startup"""
+    """Pre-load heavy modules and warm up the LLM in the background on startup"""
     finished = Signal(bool)
     
     def __init__(self):
@@ -51,43 +37,219 @@ class BackgroundLLMLoader(QObject):
         self.loaded = False
     
     def load(self):
-        """Warm up the LLM and pre-load metamodel/classifier"""
+        """Pre-import menu windows/classifier and warm up the LLM"""
         try:
-            # Step 1: Pre-load metamodel (this prints output to terminal)
-            print("⏳ Pre-loading metamodel...")
-            import metamodel
-            from nfr_queries import getEntity
-            print("✅ Metamodel loaded")
+            log.debug("Pre-loading menu windows and classifier")
+            import menu_windows
+            import classifier_v6
             
-            # Step 2: Pre-load classifier
-            print("⏳ Pre-loading classifier...")
-            from classifier_v6 import classify_fr_nfr, classify_nfr_type, classify_fr_type
-            print("✅ Classifier loaded")
-            
-            # Step 3: Warm up LLM with a quick test
-            print("⏳ Warming up LLM...")
-            import ollama
-            ollama.chat(
-                model="llama3:8b",
-                messages=[{"role": "user", "content": "hi"}],
-                options={"num_predict": 1}
-            )
-            print("✅ LLM warmed up")
+            log.debug("Warming up LLM")
+            # Through the shared MenuLLM, so the warm-up hits the same
+            # OLLAMA_HOST and model as the menu windows' requests
+            menu_llm = menu_windows._get_menu_llm()
+            if menu_llm is None:
+                raise RuntimeError("MenuLLM is not available")
+            menu_llm.warm_up()
             
             self.loaded = True
             self.finished.emit(True)
-            print("✅ All components ready!")
+            log.info("Background loading done: menu windows, classifier and LLM ready")
         except Exception as e:
-            print(f"⚠ï¸ Background loading failed: {e}")
+            log.warning("Background loading failed: %s", e)
             self.finished.emit(False)
 
 
+class BackgroundLLMRunnable(QRunnable):
+    """Runs BackgroundLLMLoader.load on Qt's global thread pool"""
+    
+    def __init__(self, loader: BackgroundLLMLoader):
+        super().__init__()
+        self.loader = loader  # Owned by the main thread, so finished is queued to it
+    
+    def run(self):
+        self.loader.load()
+
 
 # ============================================================================
 # MENU CARD AND HOME SCREEN
 # ============================================================================
 
-class MenuCard(QFrame):
+# Application-wide stylesheet, installed once in main(). Home screen widgets
+# pick their rules via objectName, so Qt parses this once instead of once
+# per widget (cards paint themselves, see _CARD_COLORS). Selectors are scoped to home screen
+# widgets so the module windows keep their own look.
+GLOBAL_QSS = """
+    HomeScreen {
+        background-color: #2c5aa0;
+    }
+
+    QLabel#cardBadge {
+        background-color: #4CAF50;
+        color: white;
+        font-size: 9pt;
+        font-weight: bold;
+        padding: 4px 10px;
+        border-radius: 10px;
+    }
+    QLabel#cardIcon {
+        padding: 0px;
+        margin: 0px;
+    }
+    QLabel#cardTitle {
+        color: #1a237e;
+        letter-spacing: 0.3px;
+        padding-top: 2px;
+    }
+    QLabel#cardDesc {
+        color: #424242;
+        line-height: 1.4;
+        letter-spacing: 0.2px;
+        padding-top: 6px;
+    }
+
+    QPushButton#submenuBtn {
+        background-color: #2196F3;
+        color: white;
+        font-size: 10pt;
+        font-weight: 600;
+        border: none;
+        border-radius: 6px;
+        padding: 6px 12px;
+        text-align: center;
+    }
+    QPushButton#submenuBtn:hover {
+        background-color: #1976D2;
+    }
+    QPushButton#submenuBtn:pressed {
+        background-color: #1565C0;
+    }
+
+    QLabel#homeTitle {
+        color: white;
+        letter-spacing: 1px;
+        padding: 10px;
+    }
+    QLabel#homeSubtitle {
+        color: #e3f2fd;
+        letter-spacing: 0.5px;
+        font-weight: 300;
+    }
+    QPushButton#helpButton {
+        background-color: #E53935;
+        color: white;
+        font-size: 12pt;
+        font-weight: bold;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+    }
+    QPushButton#helpButton:hover {
+        background-color: #C62828;
+    }
+    QPushButton#helpButton:pressed {
+        background-color: #B71C1C;
+    }
+
+    QLabel#homeFooter {
+        color: #e0e0e0;
+    }
+    QLabel#logoLabel {
+        border: none;
+        background: transparent;
+    }
+    QLabel#logoLabel:hover {
+        background: rgba(255, 255, 255, 0.1);
+        border-radius: 8px;
+    }
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _font(family: str, size: int, weight=None) -> QFont:
+    """Shared QFont per (family, size, weight); create only after QApplication exists"""
+    if weight is None:
+        return QFont(family, size)
+    return QFont(family, size, weight)
+
+
+# Card colors per color_scheme: (background, border, hover background, hover border, border width)
+_CARD_COLORS = {
+    # Green scheme - for Verification (more pronounced border)
+    'green': ("#C8E6C9", "#4CAF50", "#A5D6A7", "#388E3C", 5),
+    # Blue scheme - for Browse Examples and Classification (more pronounced border)
+    'blue': ("#BBDEFB", "#2196F3", "#90CAF9", "#1976D2", 5),
+    # Default white scheme (same for all white cards including badge items)
+    None: ("white", "#e0e0e0", "#f8fbff", "#2196F3", 2),
+}
+_CARD_RADIUS = 12
+_CARD_PADDING = 10
+
+
+@functools.lru_cache(maxsize=None)
+def _card_paint(color_scheme) -> tuple:
+    """Shared (brush, pen, hover brush, hover pen, border width) for a card color scheme"""
+    bg, border, hover_bg, hover_border, width = _CARD_COLORS.get(color_scheme, _CARD_COLORS[None])
+    return (QBrush(QColor(bg)), QPen(QColor(border), width),
+            QBrush(QColor(hover_bg)), QPen(QColor(hover_border), width), width)
+
+
+@functools.lru_cache(maxsize=None)
+def _line_height(spec: tuple) -> int:
+    """Pixel height of one line of text in the font described by spec"""
+    return QFontMetrics(_font(*spec)).height()
+
+
+# Font specs for _font(); QFont itself can't be built before QApplication
+_ICON_FONT = ("Segoe UI Emoji", 32)
+_TITLE_FONT = ("Segoe UI", 14, QFont.Bold)
+_DESC_FONT = ("Segoe UI", 11)
+_HEADER_FONT = ("Segoe UI", 32, QFont.Bold)
+_SUB_FONT = ("Segoe UI", 13)
+_FOOTER_FONT = ("Arial", 9)
+_APP_FONT = ("Arial", 10)
+
+
+# Footer logo, loaded and scaled once (None if the file is missing)
+_LOGO_FILE = "re_lab_logo.png"  # Change filename as needed
+_LOGO_DIR = os.path.dirname(os.path.abspath(__file__))
+_LOGO_CACHE = None
+_LOGO_CHECKED = False
+
+
+def _logo_pixmap():
+    """Return the logo scaled to 120x60, reading the file only on the first call"""
+    global _LOGO_CACHE, _LOGO_CHECKED
+    if not _LOGO_CHECKED:
+        _LOGO_CHECKED = True
+        # Next to this module first, so startup doesn't depend on the working directory
+        for path in (os.path.join(_LOGO_DIR, _LOGO_FILE), _LOGO_FILE):
+            if os.path.exists(path):
+                break
+        else:
+            return None
+        pixmap = QPixmap(path)
+        if not pixmap.isNull():
+            # Scale logo to reasonable size
+            _LOGO_CACHE = pixmap.scaled(120, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return _LOGO_CACHE
+
+
+@functools.lru_cache(maxsize=64)
+def _split_icon(title: str) -> tuple:
+    """
+    Split a card title into (icon, text).
+    Emojis are typically at the start, followed by space or newline;
+    returns ("", title) if the title has no emoji prefix.
+    """
+    # Check if first word is an emoji (they're usually 1-2 chars in Python)
+    parts = title.split(None, 1)
+    if len(parts) == 2 and not parts[0][0].isalnum():
+        return parts[0], parts[1].strip()
+    
+    return "", title
+
+
+class MenuCard(QWidget):
     """A clickable card for each menu item - Icon centered, title below"""
     
     def __init__(self, title: str, description: str, icon: str = None, submenu_items: list = None, badge: str = None, color_scheme: str = None, parent=None):
@@ -100,30 +262,12 @@ class MenuCard(QFrame):
         self.color_scheme = color_scheme  # 'green', 'blue', or None (default white)
         
         # Extract emoji/icon from title if present
-        # Emojis are typically at the start, followed by space or newline
-        self.icon_char = ""
-        self.title_text = title
-        
-        # Check if first character(s) are emoji (they're usually 1-2 chars in Python)
-        if title and len(title) > 1:
-            # Find the first space or newline
-            first_break = -1
-            for i, char in enumerate(title):
-                if char in ' \n':
-                    first_break = i
-                    break
-            
-            if first_break > 0:
-                potential_icon = title[:first_break].strip()
-                # Check if it looks like an emoji (not alphanumeric)
-                if potential_icon and not potential_icon[0].isalnum():
-                    self.icon_char = potential_icon
-                    self.title_text = title[first_break:].strip()
+        self.icon_char, self.title_text = _split_icon(title)
         
         # Card styling - Adjusted for 4-column layout
-        self.setFrameStyle(QFrame.Box | QFrame.Raised)
-        self.setLineWidth(0)
         self.setCursor(Qt.PointingHandCursor)
+        # Lay out by widget rect, skipping the style's layout-item rect query
+        self.setAttribute(Qt.WA_LayoutUsesWidgetRect, True)
         # Taller if has submenus (need space for buttons)
         min_height = 250 if self.submenu_items else 190
         self.setMinimumSize(280, min_height)
@@ -132,160 +276,97 @@ class MenuCard(QFrame):
         # Set minimum size to prevent overlap during resize
         self.setMinimumSize(250, 180)  # Width, Height
         
-        # Apply artistic stylesheet based on color_scheme
-        if self.color_scheme == 'green':
-            # Green scheme - for Verification (more pronounced border)
-            self.setStyleSheet("""
-                MenuCard {
-                    background-color: #C8E6C9;
-                    border: 5px solid #4CAF50;
-                    border-radius: 12px;
-                    padding: 10px;
-                }
-                MenuCard:hover {
-                    background-color: #A5D6A7;
-                    border: 5px solid #388E3C;
-                }
-            """)
-        elif self.color_scheme == 'blue':
-            # Blue scheme - for Browse Examples and Classification (more pronounced border)
-            self.setStyleSheet("""
-                MenuCard {
-                    background-color: #BBDEFB;
-                    border: 5px solid #2196F3;
-                    border-radius: 12px;
-                    padding: 10px;
-                }
-                MenuCard:hover {
-                    background-color: #90CAF9;
-                    border: 5px solid #1976D2;
-                }
-            """)
-        else:
-            # Default white scheme (same for all white cards including badge items)
-            self.setStyleSheet("""
-                MenuCard {
-                    background-color: white;
-                    border: 2px solid #e0e0e0;
-                    border-radius: 12px;
-                    padding: 10px;
-                }
-                MenuCard:hover {
-                    background-color: #f8fbff;
-                    border: 2px solid #2196F3;
-                }
-            """)
-        
-        # Layout
+        # Artistic style based on color_scheme, drawn in paintEvent
+        self._brush, self._pen, self._hover_brush, self._hover_pen, border_width = _card_paint(self.color_scheme)
+        self._hover = False
+        
+        # Layout (margins include the painted border and padding)
+        inset = border_width + _CARD_PADDING
         layout = QVBoxLayout()
         layout.setSpacing(4)
-        layout.setContentsMargins(14, 12, 14, 12)
+        layout.setContentsMargins(14 + inset, 12 + inset, 14 + inset, 12 + inset)
         
         # Badge (if provided) - at the top right
         if self.badge:
             badge_label = QLabel(self.badge)
-            badge_label.setStyleSheet("""
-                background-color: #4CAF50;
-                color: white;
-                font-size: 9pt;
-                font-weight: bold;
-                padding: 4px 10px;
-                border-radius: 10px;
-            """)
+            badge_label.setObjectName("cardBadge")
             badge_label.setAlignment(Qt.AlignCenter)
             badge_label.setFixedHeight(24)
+            badge_label.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
             layout.addWidget(badge_label, alignment=Qt.AlignCenter)
             layout.addSpacing(4)
         
         # Icon - LARGE and CENTERED
         if self.icon_char:
             icon_label = QLabel(self.icon_char)
-            icon_font = QFont("Segoe UI Emoji", 32)  # Large emoji
+            icon_font = _font(*_ICON_FONT)  # Large emoji
             icon_label.setFont(icon_font)
-            icon_label.setStyleSheet("padding: 0px; margin: 0px;")
+            icon_label.setObjectName("cardIcon")
             icon_label.setAlignment(Qt.AlignCenter)
+            # Single emoji line - fixed height so the grid never re-measures it
+            icon_label.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+            icon_label.setFixedHeight(_line_height(_ICON_FONT))
             layout.addWidget(icon_label, stretch=0)
         
         # Title text - centered below icon
         title_label = QLabel(self.title_text)
-        title_font = QFont("Segoe UI", 14, QFont.Bold)
+        title_font = _font(*_TITLE_FONT)
         title_label.setFont(title_font)
-        title_label.setStyleSheet("""
-            color: #1a237e;
-            letter-spacing: 0.3px;
-            padding-top: 2px;
-        """)
+        title_label.setObjectName("cardTitle")
         title_label.setWordWrap(True)
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label, stretch=0)
         
         # Description - left-align if contains bullets, center otherwise
-        desc_html = description.replace('\n', '<br>')
         has_bullets = '•' in description
         
-        desc_label = QLabel(desc_html)
-        desc_font = QFont("Segoe UI", 11)
+        desc_label = QLabel(description)
+        desc_font = _font(*_DESC_FONT)
         desc_label.setFont(desc_font)
-        desc_label.setStyleSheet("""
-            color: #424242;
-            line-height: 1.4;
-            letter-spacing: 0.2px;
-            padding-top: 6px;
-        """)
+        desc_label.setObjectName("cardDesc")
         desc_label.setWordWrap(True)
         # Left-align for bullet lists, center for regular text
         if has_bullets:
             desc_label.setAlignment(Qt.AlignLeft)
         else:
             desc_label.setAlignment(Qt.AlignCenter)
-        desc_label.setTextFormat(Qt.RichText)  # Enable HTML rendering
+        # Plain text renders \n line breaks itself - no rich-text engine needed
+        desc_label.setTextFormat(Qt.PlainText)
         layout.addWidget(desc_label, stretch=1)
         
         # Sub-menu buttons (if provided)
         if self.submenu_items:
-            # Add a small separator
-            layout.addSpacing(8)
-            
-            # Create a container for submenu buttons
-            submenu_layout = QVBoxLayout()
-            submenu_layout.setSpacing(6)
-            submenu_layout.setContentsMargins(0, 0, 0, 0)
-            
-            for item in self.submenu_items:
-                submenu_btn = QPushButton(item["title"])
-                submenu_btn.setMinimumHeight(32)
-                submenu_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #2196F3;
-                        color: white;
-                        font-size: 10pt;
-                        font-weight: 600;
-                        border: none;
-                        border-radius: 6px;
-                        padding: 6px 12px;
-                        text-align: center;
-                    }
-                    QPushButton:hover {
-                        background-color: #1976D2;
-                    }
-                    QPushButton:pressed {
-                        background-color: #1565C0;
-                    }
-                """)
-                submenu_btn.setCursor(Qt.PointingHandCursor)
-                
-                # Connect callback
-                if "callback" in item and item["callback"]:
-                    submenu_btn.clicked.connect(item["callback"])
-                
-                submenu_layout.addWidget(submenu_btn)
-            
-            layout.addLayout(submenu_layout)
+            self._build_submenu(layout)
         
         layout.addStretch(1)
         self.setLayout(layout)
     
 
+    def _build_submenu(self, layout):
+        """Add the sub-menu buttons below the description"""
+        # Add a small separator
+        layout.addSpacing(8)
+        
+        # Create a container for submenu buttons
+        submenu_layout = QVBoxLayout()
+        submenu_layout.setSpacing(6)
+        submenu_layout.setContentsMargins(0, 0, 0, 0)
+        
+        for item in self.submenu_items:
+            submenu_btn = QPushButton(item["title"])
+            submenu_btn.setMinimumHeight(32)
+            submenu_btn.setObjectName("submenuBtn")
+            submenu_btn.setCursor(Qt.PointingHandCursor)
+            submenu_btn.setAttribute(Qt.WA_LayoutUsesWidgetRect, True)
+            
+            # Connect callback
+            if "callback" in item and item["callback"]:
+                submenu_btn.clicked.connect(item["callback"])
+            
+            submenu_layout.addWidget(submenu_btn)
+        
+        layout.addLayout(submenu_layout)
+    
     def set_callback(self, callback):
         """Set function to call when card is clicked"""
         self.callback = callback
@@ -295,6 +376,115 @@ class MenuCard(QFrame):
         if self.callback:
             self.callback()
         super().mousePressEvent(event)
+    
+    def enterEvent(self, event):
+        """Switch to hover colors"""
+        self._hover = True
+        self.update()
+        super().enterEvent(event)
+    
+    def leaveEvent(self, event):
+        """Switch back to normal colors"""
+        self._hover = False
+        self.update()
+        super().leaveEvent(event)
+    
+    def paintEvent(self, event):
+        """Draw the rounded card background and border"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        pen = self._hover_pen if self._hover else self._pen
+        painter.setPen(pen)
+        painter.setBrush(self._hover_brush if self._hover else self._brush)
+        half = pen.widthF() / 2
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(half, half, -half, -half),
+                                _CARD_RADIUS, _CARD_RADIUS)
+
+
+class ClickableLabel(QLabel):
+    """A label that calls a callback when clicked (used for the footer logo)"""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.callback = None
+    
+    def set_callback(self, callback):
+        """Set function to call when label is clicked"""
+        self.callback = callback
+    
+    def mousePressEvent(self, event):
+        """Handle click event"""
+        if self.callback:
+            self.callback()
+        super().mousePressEvent(event)
+
+
+# Home screen menu entries; callback and submenu callbacks name HomeScreen methods
+MenuItem = namedtuple(
+    "MenuItem", "title description callback submenu badge color_scheme",
+    defaults=(None, None, None)
+)
+
+# Menu items with icons/emoji - 9 items in 5+4 grid
+_MENU_ITEMS = (
+    MenuItem(
+        "📖 What is X(NFR)?",
+        "Enter an NFR of your choice.",
+        "open_whats_this",
+        badge="🚀 START HERE"
+    ),
+    MenuItem(
+        "🌳 What does X mean? (Decomposition)",
+        "Split an NFR into its decompositions to understand its structure",
+        "open_decomposition"
+    ),
+    MenuItem(
+        "🔧 How to achieve X? (Operationalizations)",
+        "Explore design decisions and techniques to satisfy an NFR",
+        "open_operationalizations"
+    ),
+    MenuItem(
+        "⚡ Possible side effects? (Contributions)",
+        "See which NFRs an operationalization affects",
+        "open_side_effects"
+    ),
+    MenuItem(
+        "📚 What is the justification? (Claim)",
+        "See who proposed the decomposition approach and why",
+        "open_claims"
+    ),
+    MenuItem(
+        "🔍 Verification",
+        "Verify and validate requirements against quality criteria",
+        "open_verification",
+        color_scheme="green"
+    ),
+    MenuItem(
+        "📋 Browse Examples",
+        "Explore entities, relationships, and constraints in the metamodel",
+        "open_examples",
+        submenu=(
+            ("NFR Types", "open_nfr_types"),
+            ("Operationalizing Softgoals", "open_op_softgoals"),
+            ("Claim Softgoals", "open_claim_softgoals"),
+        ),
+        color_scheme="blue"
+    ),
+    MenuItem(
+        "✅ Requirement Classification",
+        "Classify requirements into:\n• FR / NFR\n• their specific types",
+        "open_classification",
+        color_scheme="blue"
+    ),
+    MenuItem(
+        "💬 Chat",
+        "Free-form conversation about the NFR Framework",
+        "open_chat"
+    ),
+)
+
+# (row, column) of each menu item in the 5+4 grid (5 on top row, 4 on bottom row)
+_GRID_POSITIONS = tuple(divmod(i, 5) for i in range(len(_MENU_ITEMS)))
 
 
 class HomeScreen(QMainWindow):
@@ -304,17 +494,31 @@ class HomeScreen(QMainWindow):
         super().__init__()
         self.setWindowTitle("NFR Elicitation AI Assistant")
         self.setMinimumSize(1600, 900)  # Larger window for 5+4 grid layout
-        
-        # Start background LLM loading
-        self.llm_loader = BackgroundLLMLoader()
-        self.llm_thread = threading.Thread(target=self.llm_loader.load, daemon=True)
-        self.llm_thread.start()
-        
-        # Set window background
-        self.setStyleSheet("QMainWindow { background-color: #2c5aa0; }")
+        self.resize(1600, 900)  # First layout pass happens at the final size
+        
+        # Module windows, created lazily by the open_* callbacks
+        self.info_window = None
+        self.whats_this_window = None
+        self.decomposition_window = None
+        self.claims_window = None
+        self.operationalizations_window = None
+        self.examples_window = None
+        self.nfr_types_window = None
+        self.op_softgoals_window = None
+        self.claim_softgoals_window = None
+        self.side_effects_window = None
+        self.verification_window = None
+        self.classification_window = None
+        self.chat_window = None
+        
+        # Start background LLM loading once the event loop has painted the window
+        self.llm_loader = None
+        self.llm_ready = False
+        QTimer.singleShot(0, self._start_llm_loader)
         
         # Central widget
         central_widget = QWidget()
+        central_widget.setUpdatesEnabled(False)  # One layout/paint pass once built
         self.setCentralWidget(central_widget)
         
         # Main layout with adjusted margins for more card space
@@ -330,6 +534,21 @@ class HomeScreen(QMainWindow):
         
         # Footer
         self._create_footer(main_layout)
+        
+        central_widget.setUpdatesEnabled(True)
+    
+    def _start_llm_loader(self):
+        """Start background LLM loading on the global thread pool"""
+        self.llm_loader = BackgroundLLMLoader()
+        # Loader lives on the GUI thread, so finished is delivered back here queued
+        self.llm_loader.finished.connect(self._on_llm_loaded)
+        self.llm_runnable = BackgroundLLMRunnable(self.llm_loader)
+        QThreadPool.globalInstance().start(self.llm_runnable)
+    
+    def _on_llm_loaded(self, ok):
+        """Record whether background loading/warm-up succeeded"""
+        self.llm_ready = ok
+        log.debug("Background LLM loading finished (ok=%s)", ok)
     
     def _create_header(self, parent_layout):
         """Create header with artistic title, subtitle, and Help button"""
@@ -337,8 +556,8 @@ class HomeScreen(QMainWindow):
         header_outer_layout = QHBoxLayout()
         header_outer_layout.setContentsMargins(20, 10, 20, 0)
         
-        # Left spacer for balance
-        header_outer_layout.addStretch(1)
+        # Fixed left spacing matching the Help button width keeps the title centered
+        header_outer_layout.addSpacing(120)
         
         # Center vertical layout for title and subtitle
         header_layout = QVBoxLayout()
@@ -346,62 +565,33 @@ class HomeScreen(QMainWindow):
         
         # Title - more artistic with better font
         title = QLabel("NFR Elicitation AI Assistant")
-        title_font = QFont("Segoe UI", 32, QFont.Bold)
+        title_font = _font(*_HEADER_FONT)
         title.setFont(title_font)
-        title.setStyleSheet("""
-            color: white;
-            letter-spacing: 1px;
-            padding: 10px;
-        """)
+        title.setObjectName("homeTitle")
         title.setAlignment(Qt.AlignCenter)
         header_layout.addWidget(title)
         
         # Subtitle - elegant styling
         subtitle = QLabel("Requirements Engineering powered by the NFR Framework")
-        subtitle_font = QFont("Segoe UI", 13)
+        subtitle_font = _font(*_SUB_FONT)
         subtitle.setFont(subtitle_font)
-        subtitle.setStyleSheet("""
-            color: #e3f2fd;
-            letter-spacing: 0.5px;
-            font-weight: 300;
-        """)
+        subtitle.setObjectName("homeSubtitle")
         subtitle.setAlignment(Qt.AlignCenter)
         header_layout.addWidget(subtitle)
         
-        header_outer_layout.addLayout(header_layout)
-        
-        # Right spacer (smaller to make room for Help button)
-        header_outer_layout.addStretch(1)
+        header_outer_layout.addLayout(header_layout, stretch=1)
         
         # Help button on the right
         help_button = QPushButton("❓ Help")
         help_button.setMinimumSize(100, 40)
         help_button.setMaximumSize(120, 40)
-        help_button.setStyleSheet("""
-            QPushButton {
-                background-color: #E53935;
-                color: white;
-                font-size: 12pt;
-                font-weight: bold;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #C62828;
-            }
-            QPushButton:pressed {
-                background-color: #B71C1C;
-            }
-        """)
+        help_button.setObjectName("helpButton")
         help_button.setCursor(Qt.PointingHandCursor)
+        help_button.setAttribute(Qt.WA_LayoutUsesWidgetRect, True)
         help_button.clicked.connect(self.open_info)
         
         # Add button aligned to top right
-        button_container = QVBoxLayout()
-        button_container.addWidget(help_button)
-        button_container.addStretch()
-        header_outer_layout.addLayout(button_container)
+        header_outer_layout.addWidget(help_button, 0, Qt.AlignRight | Qt.AlignTop)
         
         parent_layout.addLayout(header_outer_layout)
     
@@ -412,86 +602,7 @@ class HomeScreen(QMainWindow):
         grid_layout.setSpacing(25)  # Space between cards (increased for 5+4 layout)
         grid_layout.setContentsMargins(0, 0, 0, 0)  # No extra margins
         
-        # Define menu items with icons/emoji - 8 items in 4x2 grid
-        menu_items = [
-            {
-                "title": "📖 What is X(NFR)?",
-                "description": "Enter an NFR of your choice.",
-                "callback": self.open_whats_this,
-                "badge": "🚀 START HERE"
-            },
-            {
-                "title": "🌳 What does X mean? (Decomposition)",
-                "description": "Split an NFR into its decompositions to understand its structure",
-                "callback": self.open_decomposition
-            },
-            {
-                "title": "🔧 How to achieve X? (Operationalizations)",
-                "description": "Explore design decisions and techniques to satisfy an NFR",
-                "callback": self.open_operationalizations
-            },
-            {
-                "title": "⚡ Possible side effects? (Contributions)",
-                "description": "See which NFRs an operationalization affects",
-                "callback": self.open_side_effects
-            },
-            {
-                "title": "📚 What is the justification? (Claim)",
-                "description": "See who proposed the decomposition approach and why",
-                "callback": self.open_claims
-            },
-            {
-                "title": "🔍 Verification",
-                "description": "Verify and validate requirements against quality criteria",
-                "callback": self.open_verification,
-                "color_scheme": "green"
-            },
-            {
-                "title": "📋 Browse Examples",
-                "description": "Explore entities, relationships, and constraints in the metamodel",
-                "callback": self.open_examples,
-                "submenu_items": [
-                    {"title": "NFR Types", "callback": self.open_nfr_types},
-                    {"title": "Operationalizing Softgoals", "callback": self.open_op_softgoals},
-                    {"title": "Claim Softgoals", "callback": self.open_claim_softgoals}
-                ],
-                "color_scheme": "blue"
-            },
-            {
-                "title": "✅ Requirement Classification",
-                "description": "Classify requirements into:\n• FR / NFR\n• their specific types",
-                "callback": self.open_classification,
-                "color_scheme": "blue"
-            },
-            {
-                "title": "💬 Chat",
-                "description": "Free-form conversation about the NFR Framework",
-                "callback": self.open_chat
-            }
-        ]
-        
-        # Create cards in 5+4 grid (5 on top row, 4 on bottom row)
-        for i, item in enumerate(menu_items):
-            # First 5 items go on row 0
-            if i < 5:
-                row = 0
-                col = i
-            # Next 4 items go on row 1
-            else:
-                row = 1
-                col = i - 5
-            
-            card = MenuCard(
-                title=item["title"],
-                description=item["description"],
-                submenu_items=item.get("submenu_items", None),
-                badge=item.get("badge", None),
-                color_scheme=item.get("color_scheme", None)
-            )
-            card.set_callback(item["callback"])
-            
-            grid_layout.addWidget(card, row, col)
-        
+        # Stretches set before any card is added, so they never re-invalidate it
         # Set column stretch to distribute space evenly (5 columns to accommodate top row)
         for col in range(5):
             grid_layout.setColumnStretch(col, 1)
@@ -500,6 +611,26 @@ class HomeScreen(QMainWindow):
         for row in range(2):
             grid_layout.setRowStretch(row, 1)
         
+        # Create cards in 5+4 grid, one pass over the position table
+        for item, (row, col) in zip(_MENU_ITEMS, _GRID_POSITIONS):
+            submenu_items = None
+            if item.submenu:
+                submenu_items = [
+                    {"title": title, "callback": getattr(self, callback_name)}
+                    for title, callback_name in item.submenu
+                ]
+            
+            card = MenuCard(
+                title=item.title,
+                description=item.description,
+                submenu_items=submenu_items,
+                badge=item.badge,
+                color_scheme=item.color_scheme
+            )
+            card.set_callback(getattr(self, item.callback))
+            
+            grid_layout.addWidget(card, row, col)
+        
         parent_layout.addLayout(grid_layout, stretch=1)
     
     def _create_footer(self, parent_layout):
@@ -509,9 +640,9 @@ class HomeScreen(QMainWindow):
         
         # Footer text on left
         footer = QLabel("Master's Thesis Project - UT Dallas - 2024/2025")
-        footer_font = QFont("Arial", 9)
+        footer_font = _font(*_FOOTER_FONT)
         footer.setFont(footer_font)
-        footer.setStyleSheet("color: #e0e0e0;")
+        footer.setObjectName("homeFooter")
         footer.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         footer_layout.addWidget(footer)
         
@@ -520,133 +651,137 @@ class HomeScreen(QMainWindow):
         
         # Logo on right (if available) - CLICKABLE
         try:
-            from PySide6.QtGui import QPixmap, QIcon
-            
-            # Create clickable logo button
-            logo_button = QPushButton()
-            logo_button.setFlat(True)
-            logo_button.setCursor(Qt.PointingHandCursor)
-            logo_button.setStyleSheet("""
-                QPushButton {
-                    border: none;
-                    background: transparent;
-                }
-                QPushButton:hover {
-                    background: rgba(255, 255, 255, 0.1);
-                    border-radius: 8px;
-                }
-            """)
+            scaled_pixmap = _logo_pixmap()
+            if scaled_pixmap is not None:
             
-            # Try to load logo (you can change the path)
-            pixmap = QPixmap("re_lab_logo.png")  # Change filename as needed
-            if not pixmap.isNull():
-                # Scale logo to reasonable size
-                scaled_pixmap = pixmap.scaled(120, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                logo_button.setIcon(QIcon(scaled_pixmap))
-                logo_button.setIconSize(scaled_pixmap.size())
-                logo_button.setFixedSize(scaled_pixmap.size())
+                # Clickable logo - pixmap set directly, no QIcon/button size probing
+                logo_label = ClickableLabel()
+                logo_label.setObjectName("logoLabel")
+                logo_label.setCursor(Qt.PointingHandCursor)
+                logo_label.setPixmap(scaled_pixmap)
+                logo_label.setFixedSize(scaled_pixmap.size())
                 
                 # Make it clickable - open URL
-                logo_button.clicked.connect(lambda: self.open_logo_url())
+                logo_label.set_callback(self.open_logo_url)
                 
-                footer_layout.addWidget(logo_button)
-        except:
-            # If logo not found, just skip it
+                footer_layout.addWidget(logo_label)
+        except (OSError, RuntimeError):
+            # Logo unreadable - just skip it
             pass
         
         parent_layout.addLayout(footer_layout)
     
-    # Menu item callbacks
+    def _show_module(self, window):
+        """Hide the home screen and show a (possibly reused) module window"""
+        window._navigating_pipeline = False  # Closing it should bring the home screen back
+        window.reset_state()  # No input, results or history left over from the last visit
+        self.hide()
+        window.show()
+    
+    # Menu item callbacks - each module window is built on first use, then reused
     def open_info(self):
         """Open Info module - What is this tool for?"""
-        print("Opening Info...")
-        self.hide()
-        self.info_window = InfoWindow("What is this (tool) for?", self)
-        self.info_window.show()
+        log.debug("Opening Info")
+        if self.info_window is None:
+            from menu_windows import InfoWindow
+            self.info_window = InfoWindow("What is this (tool) for?", self)
+        self._show_module(self.info_window)
     
     def open_whats_this(self):
         """Open What is (NFR/FR)? module"""
-        print("Opening What is NFR/FR...")
-        self.hide()
-        self.whats_this_window = WhatsThisWindow("What is (NFR/FR)?", self)
-        self.whats_this_window.show()
+        log.debug("Opening What is NFR/FR")
+        if self.whats_this_window is None:
+            from menu_windows import WhatsThisWindow
+            self.whats_this_window = WhatsThisWindow("What is (NFR/FR)?", self)
+        self._show_module(self.whats_this_window)
     
     def open_decomposition(self):
         """Open Decomposition module - General (all types)"""
-        print("Opening Decomposition (General)...")
-        self.hide()
-        self.decomposition_window = DecompositionWindow("What does X mean? (Decomposition)", self)
-        self.decomposition_window.show()
+        log.debug("Opening Decomposition (General)")
+        if self.decomposition_window is None:
+            from menu_windows import DecompositionWindow
+            self.decomposition_window = DecompositionWindow("What does X mean? (Decomposition)", self)
+        self._show_module(self.decomposition_window)
     
     def open_claims(self):
         """Open Claims/Justification module"""
-        print("Opening Claims...")
-        self.hide()
-        self.claims_window = AttributionWindow("What is the justification? (Claim)", self)
-        self.claims_window.show()
+        log.debug("Opening Claims")
+        if self.claims_window is None:
+            from menu_windows import AttributionWindow
+            self.claims_window = AttributionWindow("What is the justification? (Claim)", self)
+        self._show_module(self.claims_window)
     
     def open_operationalizations(self):
         """Open How to achieve X? - shows operationalizations for NFRs"""
-        print("Opening How to achieve X? (Operationalizations)...")
-        self.hide()
-        self.operationalizations_window = OperationalizationDecompositionWindow("Operationalizations - Functional Decisions", self)
-        self.operationalizations_window.show()
+        log.debug("Opening How to achieve X? (Operationalizations)")
+        if self.operationalizations_window is None:
+            from menu_windows import OperationalizationDecompositionWindow
+            self.operationalizations_window = OperationalizationDecompositionWindow("Operationalizations - Functional Decisions", self)
+        self._show_module(self.operationalizations_window)
     
     def open_examples(self):
         """Open Examples Browser module"""
-        print("Opening Examples Browser...")
-        self.hide()
-        self.examples_window = ExamplesWindow("Browse Examples", self)
-        self.examples_window.show()
+        log.debug("Opening Examples Browser")
+        if self.examples_window is None:
+            from menu_windows import ExamplesWindow
+            self.examples_window = ExamplesWindow("Browse Examples", self)
+        self._show_module(self.examples_window)
     
     def open_nfr_types(self):
         """Open NFR Types sub-menu"""
-        print("Opening NFR Types...")
-        self.hide()
-        self.nfr_types_window = NFRTypesWindow("NFR Type Examples", self)
-        self.nfr_types_window.show()
+        log.debug("Opening NFR Types")
+        if self.nfr_types_window is None:
+            from menu_windows import NFRTypesWindow
+            self.nfr_types_window = NFRTypesWindow("NFR Type Examples", self)
+        self._show_module(self.nfr_types_window)
     
     def open_op_softgoals(self):
         """Open Operationalizing Softgoals sub-menu"""
-        print("Opening Operationalizing Softgoals...")
-        self.hide()
-        self.op_softgoals_window = OperationalizingSoftgoalsWindow("Operationalizing Softgoal Examples", self)
-        self.op_softgoals_window.show()
+        log.debug("Opening Operationalizing Softgoals")
+        if self.op_softgoals_window is None:
+            from menu_windows import OperationalizingSoftgoalsWindow
+            self.op_softgoals_window = OperationalizingSoftgoalsWindow("Operationalizing Softgoal Examples", self)
+        self._show_module(self.op_softgoals_window)
     
     def open_claim_softgoals(self):
         """Open Claim Softgoals sub-menu"""
-        print("Opening Claim Softgoals...")
-        self.hide()
-        self.claim_softgoals_window = ClaimSoftgoalsWindow("Claim Softgoal Examples", self)
-        self.claim_softgoals_window.show()
+        log.debug("Opening Claim Softgoals")
+        if self.claim_softgoals_window is None:
+            from menu_windows import ClaimSoftgoalsWindow
+            self.claim_softgoals_window = ClaimSoftgoalsWindow("Claim Softgoal Examples", self)
+        self._show_module(self.claim_softgoals_window)
     
     def open_side_effects(self):
         """Open Side Effects module - Contributions"""
-        print("Opening Side Effects...")
-        self.hide()
-        self.side_effects_window = SideEffectsWindow("Possible side effects? (Contributions)", self)
-        self.side_effects_window.show()
+        log.debug("Opening Side Effects")
+        if self.side_effects_window is None:
+            from menu_windows import SideEffectsWindow
+            self.side_effects_window = SideEffectsWindow("Possible side effects? (Contributions)", self)
+        self._show_module(self.side_effects_window)
     
     def open_verification(self):
         """Open Verification module"""
-        print("Opening Verification...")
-        self.hide()
-        self.verification_window = VerificationWindow("Verification", self)
-        self.verification_window.show()
+        log.debug("Opening Verification")
+        if self.verification_window is None:
+            from menu_windows import VerificationWindow
+            self.verification_window = VerificationWindow("Verification", self)
+        self._show_module(self.verification_window)
     
     def open_classification(self):
         """Open Requirement Classification module"""
-        print("Opening Classification...")
-        self.hide()
-        self.classification_window = ClassificationWindow("Requirement Classification", self)
-        self.classification_window.show()
+        log.debug("Opening Classification")
+        if self.classification_window is None:
+            from menu_windows import ClassificationWindow
+            self.classification_window = ClassificationWindow("Requirement Classification", self)
+        self._show_module(self.classification_window)
     
     def open_chat(self):
         """Open Chat window"""
-        print("Opening Chat...")
-        self.hide()
-        self.chat_window = ChatWindow("Chat - NFR Framework Assistant", self)
-        self.chat_window.show()
+        log.debug("Opening Chat")
+        if self.chat_window is None:
+            from menu_windows import ChatWindow
+            self.chat_window = ChatWindow("Chat - NFR Framework Assistant", self)
+        self._show_module(self.chat_window)
     
     def open_logo_url(self):
         """Open URL when logo is clicked"""
@@ -676,11 +811,15 @@ def main():
     print("💡 TIP: Place 're_lab_logo.png' in the same directory to show logo")
     print()
     
+    # Status logging off the click path unless explicitly enabled
+    logging.basicConfig(level=logging.WARNING)
+    
     # Create application
     app = QApplication(sys.argv)
+    app.setStyleSheet(GLOBAL_QSS)  # Parsed once for every home screen widget
     
     # Set application-wide font
-    app_font = QFont("Arial", 10)
+    app_font = _font(*_APP_FONT)
     app.setFont(app_font)
     
     # Create and show home screen
@@ -4,13 +4,131 @@ NFR Assistant - MenuLLM Module
 Lightweight LLM wrapper for menu-driven interactions
 """
 
-import ollama
+import os
+import re
+import hashlib
+import functools
+import logging
+import threading
 import json
+import string
+from collections import OrderedDict
+from ollama import Client
 
 # Import from same directory (flat structure)
 from prompt_templates import MENU_PROMPTS
 from system_prompt import MENU_LLM_SYSTEM_PROMPT
 
+log = logging.getLogger(__name__)
+
+# Sampling options shared by every action; num_predict is added per action below
+_BASE_OPTIONS = {
+    "temperature": 0.3,      # Lower = faster, more deterministic
+    "top_p": 0.8,            # Slightly lower for speed
+    "num_ctx": 2048,         # Limit context window for speed
+}
+
+# Turn markers: these only fire when the model runs past its answer and
+# starts writing the next turn - stops it decoding early
+_STOP = ["\nUser:", "\nUser query:"]
+
+# Seconds Ollama may go without sending anything - bounds the wait for the
+# first token and any stall between tokens, not total generation time
+# (slow CPU-only machines still finish long answers)
+_STALL_TIMEOUT = float(os.environ.get("MENU_LLM_TIMEOUT", "120"))
+
+_RULE = "-" * 70
+
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+# In-memory LRU of finished responses, keyed by (model, action, prompt digest)
+_RESPONSE_CACHE = OrderedDict()
+_RESPONSE_CACHE_SIZE = 256
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+def _response_key(model, action_type, prompt):
+    """Cache key for a response: model, action and a digest of the full prompt"""
+    digest = hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest()
+    return f"{model}|{action_type}|{digest}"
+
+
+def _cache_get(key):
+    """Return the cached response for key, or None"""
+    with _RESPONSE_CACHE_LOCK:
+        if key in _RESPONSE_CACHE:
+            _RESPONSE_CACHE.move_to_end(key)
+            return _RESPONSE_CACHE[key]
+    return None
+
+
+def _cache_put(key, text):
+    """Store a finished response in the LRU"""
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[key] = text
+        _RESPONSE_CACHE.move_to_end(key)
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+
+
+# Separator lines ("-----", "=====", "─────") and runs of blank lines carry no content
+_RULE_LINE = re.compile(r"^[ \t]*[-=─_*]{3,}[ \t]*$", re.MULTILINE)
+_TRAILING_SPACE = re.compile(r"[ \t]+$", re.MULTILINE)
+_BLANK_RUNS = re.compile(r"\n{3,}")
+
+
+# Listing actions whose long metamodel dumps are trimmed before prompting;
+# other prompts (verification, chat, ...) are sent exactly as built
+_TRIMMED_CONTEXT_ACTIONS = frozenset(("browse_entity", "show_sources", "show_claims"))
+
+
+def _trim_context(text):
+    """Strip layout-only lines from a string context, to cut prompt tokens"""
+    text = _TRAILING_SPACE.sub("", _RULE_LINE.sub("", text))
+    return _BLANK_RUNS.sub("\n\n", text).strip()
+
+
+_USER_SLOT, _CONTEXT_SLOT = object(), object()
+
+
+def _compile_template(template):
+    """
+    Pre-parse a template into a two-argument formatter f(user_input, context).
+    Returns None if the template uses anything but plain {user_input}/{context}.
+    """
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        if literal:
+            parts.append(literal)
+        if field is None:
+            continue
+        if field not in ("user_input", "context") or spec or conversion:
+            return None
+        parts.append(_CONTEXT_SLOT if field == "context" else _USER_SLOT)
+    parts = tuple(parts)
+    return lambda u, c: "".join(
+        u if p is _USER_SLOT else c if p is _CONTEXT_SLOT else p for p in parts
+    )
+
+
+# Formatter per MENU_PROMPTS template, parsed once at import
+_FORMATTERS = {name: _compile_template(t) for name, t in MENU_PROMPTS.items()}
+
+
+@functools.lru_cache(maxsize=256)
+def _format_prompt(action_type, user_input, context_str):
+    """Fill the MENU_PROMPTS template for action_type (memoized per input)"""
+    # Get appropriate template
+    formatter = _FORMATTERS.get(action_type, _FORMATTERS["default"])
+    if formatter is not None:
+        return formatter(user_input, context_str)
+    
+    # Fallback if template expects other variables
+    return f"User query: {user_input}\n\nMetamodel context:\n{context_str}\n\nProvide a helpful response."
+
 
 class MenuLLM:
     """
@@ -49,6 +167,27 @@ class MenuLLM:
         "default": 1000,
     }
     
+    # Complete Ollama options per action, built once (shared - never mutate them)
+    OPTIONS_BY_ACTION = {
+        a: {**_BASE_OPTIONS, "num_predict": n, "stop": _STOP}
+        for a, n in TOKEN_LIMITS.items()
+    }
+    
+    # Presentation actions routed to a smaller, faster model; everything else
+    # uses self.model. Only browse_entity (the four Browse Examples windows)
+    # goes to the small model today. Install with: ollama pull llama3.2:3b, and
+    # run the server with OLLAMA_MAX_LOADED_MODELS=2 so both models stay resident.
+    # If the small model isn't installed, these actions fall back to self.model.
+    MODEL_ROUTING = {
+        "browse_entity": "llama3.2:3b",
+    }
+    
+    # Routed models the server reported as missing (shared by all instances)
+    _unavailable_models = set()
+    
+    # How long Ollama keeps a model loaded after each request (default is 5m)
+    KEEP_ALIVE = "30m"
+    
     def __init__(self, model_name="llama3.1:8b"):
         """
         Initialize MenuLLM.
@@ -60,6 +199,32 @@ class MenuLLM:
         """
         self.model = model_name
         self.system_prompt = MENU_LLM_SYSTEM_PROMPT
+        # One persistent client so every request reuses the same HTTP connection pool
+        self._host = os.environ.get("OLLAMA_HOST", "http://localhost:11434")
+        self._client = Client(host=self._host, timeout=_STALL_TIMEOUT)
+    
+    def warm_up(self):
+        """
+        Load self.model on the server with a 1-token request, using the same
+        host, system prompt and options as real requests so the loaded model
+        and the cached prompt prefix are reused by the first query.
+        """
+        self._client.chat(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": self.system_prompt},
+                {"role": "user", "content": "hi"}
+            ],
+            options={**_BASE_OPTIONS, "num_predict": 1},
+            keep_alive=self.KEEP_ALIVE  # Keep weights resident while the user browses
+        )
+    
+    def _model_for(self, action_type):
+        """Model to use for action_type (MODEL_ROUTING, else self.model)"""
+        model = self.MODEL_ROUTING.get(action_type, self.model)
+        if model in self._unavailable_models:
+            return self.model
+        return model
     
     def respond(self, action_type, user_input, metamodel_context):
         """
@@ -74,48 +239,77 @@ class MenuLLM:
             str - Natural language response from LLM
         """
         try:
-            # DEBUG: Print inputs
-            print()
-            print("="*70)
-            print("MenuLLM.respond() DEBUG")
-            print("="*70)
-            print("Action Type:", action_type)
-            print("User Input:", user_input)
-            print()
-            print("Metamodel Context:")
-            print("-"*70)
-            print(metamodel_context)
-            print("-"*70)
-            
-            # Build prompt
-            prompt = self._build_prompt(action_type, user_input, metamodel_context)
-            
-            print()
-            print("Prompt Template Name:", action_type)
-            print("Full Prompt being sent to LLM:")
-            print("-"*70)
-            print(prompt)
-            print("-"*70)
-            
-            # Call LLM with action-specific token limit
-            response = self._call_llm(prompt, action_type)
-            
-            print()
-            print("LLM Response:")
-            print("-"*70)
-            print(response)
-            print("="*70)
-            
-            return response
-            
+            return "".join(self._respond_chunks(action_type, user_input, metamodel_context))
+        except Exception as e:
+            return self._fallback(e, metamodel_context)
+    
+    def respond_stream(self, action_type, user_input, metamodel_context):
+        """
+        Like respond(), but yields the response text as the LLM produces it,
+        so callers can show the first tokens without waiting for the rest.
+        
+        If the LLM fails before producing anything the respond() fallback is
+        yielded; if it fails part-way only a short "interrupted" marker follows.
+        
+        Yields:
+            str - successive chunks of the natural language response
+        """
+        started = False
+        try:
+            for chunk in self._respond_chunks(action_type, user_input, metamodel_context):
+                started = True
+                yield chunk
         except Exception as e:
-            # Fallback to raw metamodel context on error
-            return f"⚠️ Error generating LLM response: {str(e)}\n\n---\n\nRaw metamodel data:\n{metamodel_context}"
+            if not started:
+                yield self._fallback(e, metamodel_context)
+                return
+            log.warning("LLM response interrupted: %s", e)
+            yield "\n\n[response interrupted]"
+    
+    @staticmethod
+    def _fallback(error, metamodel_context):
+        """Error text shown instead of a response: the raw metamodel context"""
+        return f"⚠️ Error generating LLM response: {str(error)}\n\n---\n\nRaw metamodel data:\n{metamodel_context}"
+    
+    def _respond_chunks(self, action_type, user_input, metamodel_context):
+        """Yield the response for one request (cached or streamed); raises on error"""
+        debug = log.isEnabledFor(logging.DEBUG)
+        
+        # DEBUG: Log inputs
+        if debug:
+            log.debug("MenuLLM.respond() - action: %s, user input: %s", action_type, user_input)
+            log.debug("Metamodel Context:\n%s\n%s\n%s", _RULE, metamodel_context, _RULE)
+        
+        # Build prompt
+        prompt = self._build_prompt(action_type, user_input, metamodel_context)
+        
+        if debug:
+            log.debug("Full Prompt (%s) being sent to LLM:\n%s\n%s\n%s", action_type, _RULE, prompt, _RULE)
+        
+        # Repeat queries are answered from the cache without calling the LLM
+        key = _response_key(self._model_for(action_type), action_type, prompt)
+        cached = _cache_get(key)
+        if cached is not None:
+            log.debug("Cached response for %s", action_type)
+            yield cached
+            return
+        
+        # Stream LLM output with action-specific token limit
+        chunks = []
+        for chunk in self._stream_llm(prompt, action_type):
+            chunks.append(chunk)
+            yield chunk
+        
+        # Only complete responses are cached (a failure above skips this)
+        response = "".join(chunks)
+        _cache_put(key, response)
+        if debug:
+            log.debug("LLM Response:\n%s\n%s\n%s", _RULE, response, _RULE)
     
     def _build_prompt(self, action_type, user_input, context):
         """Build prompt using template"""
-        # Get appropriate template
-        template = MENU_PROMPTS.get(action_type, MENU_PROMPTS["default"])
+        if action_type in _TRIMMED_CONTEXT_ACTIONS and isinstance(context, str):
+            context = _trim_context(context)
         
         # Convert context to string if needed
         if isinstance(context, dict):
@@ -123,66 +317,60 @@ class MenuLLM:
         else:
             context_str = str(context)
         
-        # Format template with user input and context
-        try:
-            formatted_prompt = template.format(
-                user_input=user_input,
-                context=context_str
-            )
-        except KeyError as e:
-            # Fallback if template expects other variables
-            formatted_prompt = f"User query: {user_input}\n\nMetamodel context:\n{context_str}\n\nProvide a helpful response."
-        
-        return formatted_prompt
+        return _format_prompt(action_type, str(user_input), context_str)
     
-    def _call_llm(self, prompt, action_type="default"):
+    def _stream_llm(self, prompt, action_type="default"):
         """
-        Simple Ollama call - optimized for speed with dynamic token limits.
+        Streaming Ollama call (stream=True) - yields text as tokens arrive.
         
         Args:
             prompt: The formatted prompt string
             action_type: The type of action (determines token limit)
             
-        Returns:
-            str - LLM response text
+        Yields:
+            str - successive pieces of the LLM response text
         """
         try:
-            # Get token limit for this action type
-            num_predict = self.TOKEN_LIMITS.get(action_type, self.TOKEN_LIMITS["default"])
+            # Options with the token limit for this action type
+            options = self.OPTIONS_BY_ACTION.get(action_type) or self.OPTIONS_BY_ACTION["default"]
+            model = self._model_for(action_type)
             
-            # Try ollama.chat() first (newer API)
             try:
-                response = ollama.chat(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": self.system_prompt},
-                        {"role": "user", "content": prompt}
-                    ],
-                    options={
-                        "temperature": 0.3,      # Lower = faster, more deterministic
-                        "top_p": 0.8,            # Slightly lower for speed
-                        "num_predict": num_predict,  # Dynamic based on action type!
-                        "num_ctx": 2048,         # Limit context window for speed
-                    }
-                )
-                return response['message']['content']
-            except AttributeError:
-                # Fallback to ollama.generate() for older API versions
-                full_prompt = f"System: {self.system_prompt}\n\nUser: {prompt}"
-                response = ollama.generate(
-                    model=self.model,
-                    prompt=full_prompt,
-                    options={
-                        "temperature": 0.3,
-                        "top_p": 0.8,
-                        "num_predict": num_predict,
-                        "num_ctx": 2048,
-                    }
-                )
-                return response['response']
+                yield from self._stream_model(model, prompt, options)
+            except Exception as e:
+                # Routed model not pulled on this machine - use the default model instead
+                if model == self.model or getattr(e, "status_code", None) != 404:
+                    raise
+                self._unavailable_models.add(model)
+                yield from self._stream_model(self.model, prompt, options)
             
         except Exception as e:
             raise Exception(f"Ollama API call failed: {str(e)}")
+    
+    def _stream_model(self, model, prompt, options):
+        """Stream one Ollama request to model, yielding response text"""
+        # The system prompt is always the same first message (and num_ctx is
+        # fixed), so Ollama reuses its cached prefix instead of re-evaluating it
+        stream = self._client.chat(
+            model=model,
+            messages=[
+                {"role": "system", "content": self.system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            options=options,
+            keep_alive=self.KEEP_ALIVE,
+            stream=True
+        )
+        for chunk in stream:
+            yield chunk['message']['content']
+            if chunk.get('done'):
+                self._log_usage(model, options, chunk)
+    
+    def _log_usage(self, model, options, final):
+        """Log how many tokens a response actually used (for tuning TOKEN_LIMITS)"""
+        if log.isEnabledFor(logging.INFO):
+            log.info("%s: %s/%s tokens (%s)", model, final.get('eval_count'),
+                     options["num_predict"], final.get('done_reason'))
 
 
 # Convenience function for quick testing
@@ -5,13 +5,18 @@ Contains all menu item window classes
 """
 
 import threading
+import functools
+from collections import deque
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QGridLayout, QPushButton, QLabel, QFrame, QTextEdit, QLineEdit,
-    QScrollArea, QSizePolicy, QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox
+    QScrollArea, QSizePolicy, QTableWidget, QTableWidgetItem, QHeaderView, QMessageBox,
+    QComboBox
 )
-from PySide6.QtCore import Qt, Slot, QSize, QMetaObject, Q_ARG, Signal, QObject, QTimer
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtCore import (
+    Qt, Slot, QSize, QMetaObject, Q_ARG, Signal, QObject, QTimer, QRunnable, QThreadPool
+)
+from PySide6.QtGui import QFont, QColor, QTextCursor
 
 from utils import (
     format_entity_name,
@@ -19,7 +24,7 @@ from utils import (
     get_nfr_and_children,
     fuzzy_match_entity
 )
-from nfr_queries import getClaimsFor
+from nfr_queries import getClaimsFor, _formatted
 
 # Import MenuLLM for GenAI-powered responses
 try:
@@ -30,6 +35,75 @@ except ImportError:
     MENU_LLM_AVAILABLE = False
     MenuLLM = None
 
+# Single MenuLLM shared by all windows (see _get_menu_llm)
+_MENU_LLM_SINGLETON = None
+_MENU_LLM_LOCK = threading.Lock()  # The startup warm-up also creates it, off the UI thread
+
+
+def _get_menu_llm():
+    """Return the shared MenuLLM instance, or None if MenuLLM is unavailable"""
+    global _MENU_LLM_SINGLETON
+    with _MENU_LLM_LOCK:
+        if _MENU_LLM_SINGLETON is None and MENU_LLM_AVAILABLE:
+            _MENU_LLM_SINGLETON = MenuLLM()
+    return _MENU_LLM_SINGLETON
+
+
+class _SearchSignals(QObject):
+    """Carries a background search result back to the UI thread"""
+    done = Signal(object)
+
+
+class _SearchRunnable(QRunnable):
+    """Run fn() on QThreadPool and pass its result to on_done (a slot of a QObject)"""
+    
+    def __init__(self, fn, on_done):
+        super().__init__()
+        self.fn = fn
+        self.signals = _SearchSignals()
+        self.signals.done.connect(on_done)
+    
+    def run(self):
+        self.signals.done.emit(self.fn())
+
+
+class _StreamSignals(QObject):
+    """Carries streamed LLM text back to the UI thread"""
+    chunk = Signal(str)
+    done = Signal(str)
+
+
+class _StreamRunnable(QRunnable):
+    """Iterate a text stream on QThreadPool, emitting each chunk and then the full text"""
+    
+    def __init__(self, stream, on_chunk, on_done):
+        super().__init__()
+        self.stream = stream
+        self.signals = _StreamSignals()
+        self.signals.chunk.connect(on_chunk)
+        self.signals.done.connect(on_done)
+    
+    def run(self):
+        chunks = []
+        try:
+            for chunk in self.stream:
+                chunks.append(chunk)
+                self.signals.chunk.emit(chunk)
+        except Exception as e:
+            chunks.append(f"\n\n❌ Error: {str(e)}")
+        self.signals.done.emit("".join(chunks))
+
+
+# Contribution types counted as "helps achieve"
+_POSITIVE = frozenset(('HELP', 'MAKE'))
+
+
+@functools.lru_cache(maxsize=1)
+def _all_entity_names_lower() -> dict:
+    """Map lowercased NFR/operationalization names to their metamodel names"""
+    from nfr_queries import getAllNFRTypes, getAllOperationalizingTypes
+    return {n.lower(): n for n in getAllNFRTypes() + getAllOperationalizingTypes()}
+
 
 class ModuleWindow(QMainWindow):
     """Base window class for all module features with back button"""
@@ -64,6 +138,7 @@ class ModuleWindow(QMainWindow):
         
         # Setup module-specific content (override in subclass)
         self.setup_content()
+        self._snapshot_state()
     
     def _create_back_bar(self, parent_layout):
         """Create top bar with back button"""
@@ -123,11 +198,49 @@ class ModuleWindow(QMainWindow):
         """)
         self.content_layout.addWidget(label)
     
+    def _snapshot_state(self):
+        """Remember the freshly built widget state, for reset_state()"""
+        # Only the window's own widget attributes (panels/buttons it toggles),
+        # not Qt internals such as scroll bars
+        widgets = [w for w in vars(self).values() if isinstance(w, QWidget) and w is not self.content_widget]
+        self._initial_hidden = [(w, w.isHidden()) for w in widgets]
+        self._initial_combo_index = [(w, w.currentIndex()) for w in widgets if isinstance(w, QComboBox)]
+        results = getattr(self, 'results_label', None)
+        self._initial_results_html = results.toHtml() if results is not None else None
+    
+    def reset_state(self):
+        """
+        Put a reused window back into its freshly opened state: empty inputs,
+        initial results text, panels/buttons hidden or shown as at creation,
+        and no current entity.
+        """
+        for w in self.content_widget.findChildren(QLineEdit):
+            w.clear()
+        for w in self.content_widget.findChildren(QTextEdit):
+            if not w.isReadOnly():
+                w.clear()
+        for w, index in self._initial_combo_index:
+            w.setCurrentIndex(index)
+        for w, hidden in self._initial_hidden:
+            w.setHidden(hidden)
+        if self._initial_results_html is not None:
+            self.results_label.setHtml(self._initial_results_html)
+            self._last_results = None
+        if hasattr(self, 'current_entity'):
+            self.current_entity = None
+    
     def return_to_menu(self):
         """Close module window and show home screen"""
         self.close()
         self.parent_home_screen.show()
     
+    @Slot(str)
+    def _set_results(self, text: str):
+        """Show text in results_label, skipping the re-layout when nothing changed"""
+        if getattr(self, '_last_results', None) != text:
+            self._last_results = text
+            self.results_label.setText(text)
+    
     def closeEvent(self, event):
         """Handle window close (X button)"""
         # Only show homescreen if not navigating to another pipeline window
@@ -136,6 +249,47 @@ class ModuleWindow(QMainWindow):
         event.accept()
 
 
+def _clean_entity_name(name: str) -> str:
+    """Strip Type/Softgoal suffixes so entity names display cleanly"""
+    if not name:
+        return name
+    return name.removesuffix('Type').removesuffix('Softgoal')
+
+
+class PipelineNavigatorMixin:
+    """Shared forward navigation for the pipeline windows (keeps back history)"""
+    
+    def _navigate(self, target_cls, entity_raw, module_name, history_entity=None):
+        """
+        Open target_cls for entity_raw and close this window.
+        
+        Args:
+            target_cls: Window class to open
+            entity_raw: Entity name (Type/Softgoal suffixes are stripped)
+            module_name: Title for the target window
+            history_entity: Entity recorded for this window in the back history
+                            (defaults to the cleaned target entity)
+        
+        Returns:
+            The newly shown window
+        """
+        clean_name = _clean_entity_name(entity_raw)
+        history = self.came_from + ((type(self).__name__, history_entity or clean_name),)
+        
+        # Set flag to prevent homescreen from showing on close
+        self._navigating_pipeline = True
+        self.hide()
+        window = target_cls(
+            module_name,
+            self.parent_home_screen,
+            initial_entity=clean_name,
+            came_from=history
+        )
+        window.show()
+        self.close()
+        return window
+
+
 # Specialized Module Windows
 
 class InfoWindow(ModuleWindow):
@@ -349,7 +503,7 @@ class ClassificationWindow(ModuleWindow):
     
     def setup_content(self):
         # Initialize MenuLLM for AI-powered responses
-        self.menu_llm = MenuLLM() if MENU_LLM_AVAILABLE else None
+        self.menu_llm = _get_menu_llm()
 
         from PySide6.QtWidgets import QTextEdit, QLabel, QHBoxLayout, QMessageBox
         
@@ -531,7 +685,7 @@ class ClassificationWindow(ModuleWindow):
         
         text = self.text_input.toPlainText().strip()
         if not text:
-            self.results_label.setText("⚠ï¸ Please enter a requirement first")
+            self._set_results("⚠ï¸ Please enter a requirement first")
             return
         
         # Validate input
@@ -544,7 +698,7 @@ class ClassificationWindow(ModuleWindow):
             return
         
         # Show loading indicator immediately
-        self.results_label.setText("⏳ Classifying FR vs NFR...")
+        self._set_results("⏳ Classifying FR vs NFR...")
         QApplication.processEvents()  # Force UI update
         
         # Run classification in background thread
@@ -580,7 +734,7 @@ class ClassificationWindow(ModuleWindow):
         def run_and_update():
             result = do_classify()
             from PySide6.QtCore import QMetaObject, Qt as QtCore_Qt, Q_ARG
-            QMetaObject.invokeMethod(self.results_label, "setText", 
+            QMetaObject.invokeMethod(self, "_set_results", 
                                     QtCore_Qt.QueuedConnection, Q_ARG(str, result))
         
         thread = threading.Thread(target=run_and_update, daemon=True)
@@ -592,7 +746,7 @@ class ClassificationWindow(ModuleWindow):
         
         text = self.text_input.toPlainText().strip()
         if not text:
-            self.results_label.setText("⚠ï¸ Please enter a requirement first")
+            self._set_results("⚠ï¸ Please enter a requirement first")
             return
         
         # Validate input
@@ -605,7 +759,7 @@ class ClassificationWindow(ModuleWindow):
             return
         
         # Show loading indicator immediately
-        self.results_label.setText("⏳ Classifying specific type...")
+        self._set_results("⏳ Classifying specific type...")
         QApplication.processEvents()  # Force UI update
         
         # Run classification in background thread
@@ -670,7 +824,7 @@ class ClassificationWindow(ModuleWindow):
         def run_and_update():
             result_text = do_classify()
             from PySide6.QtCore import QMetaObject, Qt as QtCore_Qt, Q_ARG
-            QMetaObject.invokeMethod(self.results_label, "setText", 
+            QMetaObject.invokeMethod(self, "_set_results", 
                                     QtCore_Qt.QueuedConnection, Q_ARG(str, result_text))
             
             # If NFR classification successful, show navigation buttons
@@ -695,7 +849,7 @@ class ClassificationWindow(ModuleWindow):
         """Navigate to NFR Decomposition window"""
         if self.current_nfr_type:
             # Clean up entity name
-            clean_name = self.current_nfr_type.replace('Type', '').replace('Softgoal', '')
+            clean_name = _clean_entity_name(self.current_nfr_type)
             
             # Set flag to prevent homescreen from showing on close
             self._navigating_pipeline = True
@@ -713,7 +867,7 @@ class ClassificationWindow(ModuleWindow):
         """Navigate to Operationalization Decomposition window"""
         if self.current_nfr_type:
             # Clean up entity name
-            clean_name = self.current_nfr_type.replace('Type', '').replace('Softgoal', '')
+            clean_name = _clean_entity_name(self.current_nfr_type)
             
             # Set flag to prevent homescreen from showing on close
             self._navigating_pipeline = True
@@ -734,7 +888,7 @@ class DecompositionWindow(ModuleWindow):
     
     def setup_content(self):
         # Initialize MenuLLM for AI-powered responses
-        self.menu_llm = MenuLLM() if MENU_LLM_AVAILABLE else None
+        self.menu_llm = _get_menu_llm()
 
         from PySide6.QtWidgets import QLineEdit, QLabel
         
@@ -811,11 +965,11 @@ class DecompositionWindow(ModuleWindow):
         """Show decompositions for the given NFR type with LLM explanation"""
         text = self.text_input.text().strip()
         if not text:
-            self.results_label.setText("⚠️ Please enter an NFR type first")
+            self._set_results("⚠️ Please enter an NFR type first")
             return
         
         # Show loading
-        self.results_label.setText("⏳ Searching for decompositions...")
+        self._set_results("⏳ Searching for decompositions...")
         QApplication.processEvents()
         
         try:
@@ -824,14 +978,14 @@ class DecompositionWindow(ModuleWindow):
             # Fuzzy match
             matched_name, suggestion = fuzzy_match_entity(text)
             if not matched_name:
-                self.results_label.setText(suggestion)
+                self._set_results(suggestion)
                 return
             
             entity = getEntity(matched_name)
             decomps = getDecompositionsFor(entity)
             
             if not decomps:
-                self.results_label.setText(f"ℹ️ {format_entity_name(matched_name)} has no decomposition methods defined.")
+                self._set_results(f"ℹ️ {format_entity_name(matched_name)} has no decomposition methods defined.")
                 return
             
             # Build context for LLM
@@ -839,7 +993,7 @@ class DecompositionWindow(ModuleWindow):
             for i, decomp in enumerate(decomps, 1):
                 context += f"{i}. {decomp.name}\n"
                 if hasattr(decomp, 'offspring'):
-                    offspring_names = [format_entity_name(o.__name__) for o in decomp.offspring]
+                    offspring_names = [_formatted(o.__name__) for o in decomp.offspring]
                     context += f"   Offspring: {', '.join(offspring_names)}\n"
                 context += "\n"
             
@@ -850,9 +1004,9 @@ class DecompositionWindow(ModuleWindow):
                     user_input=format_entity_name(matched_name),
                     metamodel_context=context
                 )
-                self.results_label.setText(suggestion + llm_response)
+                self._set_results(suggestion + llm_response)
             else:
-                self.results_label.setText(suggestion + context)
+                self._set_results(suggestion + context)
             
             # Store current entity for navigation
             self.current_entity = matched_name
@@ -862,7 +1016,7 @@ class DecompositionWindow(ModuleWindow):
             
         except Exception as e:
             import traceback
-            self.results_label.setText(f"❌ Error: {str(e)}\n\n{traceback.format_exc()}")
+            self._set_results(f"❌ Error: {str(e)}\n\n{traceback.format_exc()}")
     
     def show_navigation_button(self):
         """Show navigation button to next step in pipeline"""
@@ -912,10 +1066,10 @@ class DecompositionWindow(ModuleWindow):
 class AttributionWindow(ModuleWindow):
     """Window for attribution (According to whom?)"""
     
-    def __init__(self, module_name: str, parent_home_screen, initial_entity: str = None, came_from: list = None):
+    def __init__(self, module_name: str, parent_home_screen, initial_entity: str = None, came_from: tuple = None):
         self.initial_entity = initial_entity
         self.current_entity = None
-        self.came_from = came_from or []  # List of (WindowClass, entity_name) tuples for back navigation history
+        self.came_from = tuple(came_from or ())  # Immutable stack of (WindowClass, entity_name) pairs for back navigation history
         super().__init__(module_name, parent_home_screen)
         
         # If initial entity provided, auto-fill and search
@@ -926,7 +1080,7 @@ class AttributionWindow(ModuleWindow):
     
     def setup_content(self):
         # Initialize MenuLLM for AI-powered responses
-        self.menu_llm = MenuLLM() if MENU_LLM_AVAILABLE else None
+        self.menu_llm = _get_menu_llm()
 
         from PySide6.QtWidgets import QLineEdit, QLabel
         
@@ -1029,11 +1183,11 @@ class AttributionWindow(ModuleWindow):
         """Show decompositions and their sources/attributions - CLAIMS EMPHASIZED"""
         text = self.text_input.text().strip()
         if not text:
-            self.results_label.setText("⚠ï¸ Please enter a softgoal first")
+            self._set_results("⚠ï¸ Please enter a softgoal first")
             return
         
         # Show loading indicator immediately
-        self.results_label.setText("⏳ Searching for justifications and sources...")
+        self._set_results("⏳ Searching for justifications and sources...")
         QApplication.processEvents()  # Force UI update
         
         # Run in background thread
@@ -1062,7 +1216,7 @@ class AttributionWindow(ModuleWindow):
                 if decomps:
                     # Collect all claims for this entity type
                     all_claims_for_type = []
-                    parent_type_name = entity_name.replace('Type', '').replace('Softgoal', '')
+                    parent_type_name = _clean_entity_name(entity_name)
                     
                     # Collect ALL ClaimSoftgoals (matching will filter later)
                     for name, obj in inspect.getmembers(metamodel):
@@ -1084,7 +1238,7 @@ class AttributionWindow(ModuleWindow):
                         # Format offspring names
                         offspring_names = []
                         if hasattr(decomp, 'offspring'):
-                            offspring_names = [format_entity_name(o.__name__) for o in decomp.offspring]
+                            offspring_names = [_formatted(o.__name__) for o in decomp.offspring]
                         
                         decomp_desc = getattr(decomp, 'description', '')
                         
@@ -1112,7 +1266,7 @@ class AttributionWindow(ModuleWindow):
                 # CASE 2: No decompositions - Check if it's an operationalization
                 # ================================================================
                 else:
-                    parent_type_name = entity_name.replace('Type', '').replace('Softgoal', '')
+                    parent_type_name = _clean_entity_name(entity_name)
                     
                     # Search for claims about this entity
                     # Try FLEXIBLE matching - match if either string contains the other
@@ -1192,7 +1346,7 @@ class AttributionWindow(ModuleWindow):
         def run_and_update():
             result = do_search()
             from PySide6.QtCore import QMetaObject, Qt as QtCore_Qt, Q_ARG
-            QMetaObject.invokeMethod(self.results_label, "setText", 
+            QMetaObject.invokeMethod(self, "_set_results", 
                                     QtCore_Qt.QueuedConnection, Q_ARG(str, result))
         
         thread = threading.Thread(target=run_and_update, daemon=True)
@@ -1253,7 +1407,7 @@ class ExamplesWindow(ModuleWindow):
     
     def setup_content(self):
         # Initialize MenuLLM for AI-powered responses
-        self.menu_llm = MenuLLM() if MENU_LLM_AVAILABLE else None
+        self.menu_llm = _get_menu_llm()
 
         from PySide6.QtWidgets import QLabel, QComboBox, QPushButton, QTextEdit, QLineEdit, QHBoxLayout
         
@@ -1412,7 +1566,7 @@ class ExamplesWindow(ModuleWindow):
     def show_examples(self):
         """Show examples for selected category"""
         category = self.category_combo.currentText()
-        self.results_label.setText(f"⏳ Loading {category}...")
+        self._set_results(f"⏳ Loading {category}...")
         QApplication.processEvents()
         
         def do_query():
@@ -1513,7 +1667,7 @@ class ExamplesWindow(ModuleWindow):
         # Run in thread
         def run_and_update():
             result = do_query()
-            QMetaObject.invokeMethod(self.results_label, "setText", 
+            QMetaObject.invokeMethod(self, "_set_results", 
                                     Qt.QueuedConnection, Q_ARG(str, result))
         
         thread = threading.Thread(target=run_and_update, daemon=True)
@@ -1611,7 +1765,7 @@ class NFRTypesWindow(ModuleWindow):
     
     def setup_content(self):
         # Initialize MenuLLM for AI-powered responses
-        self.menu_llm = MenuLLM() if MENU_LLM_AVAILABLE else None
+        self.menu_llm = _get_menu_llm()
 
         from PySide6.QtWidgets import QLabel, QPushButton, QTextEdit, QLineEdit, QHBoxLayout
         
@@ -1727,7 +1881,7 @@ class NFRTypesWindow(ModuleWindow):
         self.current_examples = []
     
     def load_examples(self):
-        self.results_label.setText("⏳ Loading NFR Types...")
+        self._set_results("⏳ Loading NFR Types...")
         QApplication.processEvents()
         
         def do_query():
@@ -1764,7 +1918,7 @@ class NFRTypesWindow(ModuleWindow):
         
         def run_and_update():
             result = do_query()
-            QMetaObject.invokeMethod(self.results_label, "setText", Qt.QueuedConnection, Q_ARG(str, result))
+            QMetaObject.invokeMethod(self, "_set_results", Qt.QueuedConnection, Q_ARG(str, result))
         
         thread = threading.Thread(target=run_and_update, daemon=True)
         thread.start()
@@ -1870,7 +2024,7 @@ class OperationalizingSoftgoalsWindow(ModuleWindow):
     
     def setup_content(self):
         # Initialize MenuLLM for AI-powered responses
-        self.menu_llm = MenuLLM() if MENU_LLM_AVAILABLE else None
+        self.menu_llm = _get_menu_llm()
 
         from PySide6.QtWidgets import QLabel, QPushButton, QTextEdit, QLineEdit, QHBoxLayout
         
@@ -1980,7 +2134,7 @@ class OperationalizingSoftgoalsWindow(ModuleWindow):
         self.current_examples = []
     
     def load_examples(self):
-        self.results_label.setText("⏳ Loading Operationalizing Softgoals...")
+        self._set_results("⏳ Loading Operationalizing Softgoals...")
         QApplication.processEvents()
         
         def do_query():
@@ -2017,7 +2171,7 @@ class OperationalizingSoftgoalsWindow(ModuleWindow):
         
         def run_and_update():
             result = do_query()
-            QMetaObject.invokeMethod(self.results_label, "setText", Qt.QueuedConnection, Q_ARG(str, result))
+            QMetaObject.invokeMethod(self, "_set_results", Qt.QueuedConnection, Q_ARG(str, result))
         
         thread = threading.Thread(target=run_and_update, daemon=True)
         thread.start()
@@ -2123,7 +2277,7 @@ class ClaimSoftgoalsWindow(ModuleWindow):
     
     def setup_content(self):
         # Initialize MenuLLM for AI-powered responses
-        self.menu_llm = MenuLLM() if MENU_LLM_AVAILABLE else None
+        self.menu_llm = _get_menu_llm()
 
         from PySide6.QtWidgets import QLabel, QPushButton, QTextEdit, QLineEdit, QHBoxLayout
         
@@ -2233,7 +2387,7 @@ class ClaimSoftgoalsWindow(ModuleWindow):
         self.current_examples = []
     
     def load_examples(self):
-        self.results_label.setText("⏳ Loading Claim Softgoals...")
+        self._set_results("⏳ Loading Claim Softgoals...")
         QApplication.processEvents()
         
         def do_query():
@@ -2264,7 +2418,7 @@ class ClaimSoftgoalsWindow(ModuleWindow):
         
         def run_and_update():
             result = do_query()
-            QMetaObject.invokeMethod(self.results_label, "setText", Qt.QueuedConnection, Q_ARG(str, result))
+            QMetaObject.invokeMethod(self, "_set_results", Qt.QueuedConnection, Q_ARG(str, result))
         
         thread = threading.Thread(target=run_and_update, daemon=True)
         thread.start()
@@ -2356,13 +2510,13 @@ class ClaimSoftgoalsWindow(ModuleWindow):
             self.details_label.setText(f"❌ Error: {str(e)}\n\n{traceback.format_exc()}")
 
 
-class SideEffectsWindow(ModuleWindow):
+class SideEffectsWindow(PipelineNavigatorMixin, ModuleWindow):
     """Window for showing contribution side effects with pipeline navigation"""
     
-    def __init__(self, module_name: str, parent_home_screen, initial_entity: str = None, came_from: list = None):
+    def __init__(self, module_name: str, parent_home_screen, initial_entity: str = None, came_from: tuple = None):
         self.initial_entity = initial_entity
         self.current_entity = None
-        self.came_from = came_from or []  # List of (WindowClass, entity_name) tuples for back navigation history
+        self.came_from = tuple(came_from or ())  # Immutable stack of (WindowClass, entity_name) pairs for back navigation history
         super().__init__(module_name, parent_home_screen)
         
         if self.initial_entity:
@@ -2372,7 +2526,7 @@ class SideEffectsWindow(ModuleWindow):
     
     def setup_content(self):
         # Initialize MenuLLM for AI-powered responses
-        self.menu_llm = MenuLLM() if MENU_LLM_AVAILABLE else None
+        self.menu_llm = _get_menu_llm()
 
         from PySide6.QtWidgets import QLineEdit, QLabel, QTextEdit
         
@@ -2512,12 +2666,12 @@ class SideEffectsWindow(ModuleWindow):
         """Show which NFRs an operationalization negatively affects (HURT/BREAK only) - synchronous"""
         text = self.op_input.text().strip()
         if not text:
-            self.results_label.setText("⚠ï¸ Please enter an operationalization")
+            self._set_results("⚠ï¸ Please enter an operationalization")
             return
         
         self.pipeline_info.setVisible(False)
         self.claims_btn.setVisible(False)
-        self.results_label.setText("⏳ Searching for side effects...")
+        self._set_results("⏳ Searching for side effects...")
         QApplication.processEvents()
         
         try:
@@ -2528,12 +2682,12 @@ class SideEffectsWindow(ModuleWindow):
             # Use fuzzy matching helper
             matched_name, suggestion = fuzzy_match_entity(text)
             if not matched_name:
-                self.results_label.setText(suggestion)
+                self._set_results(suggestion)
                 return
             
             entity = getEntity(matched_name)
             entity_name = getEntityName(entity)
-            search_name = entity_name.replace('Type', '').replace('Softgoal', '')
+            search_name = _clean_entity_name(entity_name)
             
             # Find contributions by this operationalization
             contributions = []
@@ -2595,42 +2749,28 @@ class SideEffectsWindow(ModuleWindow):
                         user_input=search_name,
                         metamodel_context=response
                     )
-                    self.results_label.setText(llm_response)
+                    self._set_results(llm_response)
                 except Exception:
-                    self.results_label.setText(response)
+                    self._set_results(response)
             else:
-                self.results_label.setText(response)
+                self._set_results(response)
             
             self.current_entity = matched_name
             self.pipeline_info.setVisible(True)
             self.claims_btn.setVisible(True)
             
         except ImportError:
-            self.results_label.setText("❌ Error: nfr_queries.py not found")
+            self._set_results("❌ Error: nfr_queries.py not found")
         except Exception as e:
             import traceback
-            self.results_label.setText(f"❌ Error: {str(e)}\n\n{traceback.format_exc()}")
+            self._set_results(f"❌ Error: {str(e)}\n\n{traceback.format_exc()}")
     
     def go_to_claims(self):
         """Navigate to Claims/Argumentation window"""
         if self.current_entity:
-            # Clean up entity name for display
-            clean_name = self.current_entity.replace('Type', '').replace('Softgoal', '')
-            
-            # Build navigation history
-            history = self.came_from + [('SideEffectsWindow', clean_name)]
-            
-            # Set flag to prevent homescreen from showing on close
-            self._navigating_pipeline = True
-            self.hide()
-            self.claims_window = AttributionWindow(
-                "What is the justification? (Claim)", 
-                self.parent_home_screen,
-                initial_entity=clean_name,
-                came_from=history
+            self.claims_window = self._navigate(
+                AttributionWindow, self.current_entity, "What is the justification? (Claim)"
             )
-            self.claims_window.show()
-            self.close()
     
     def go_back(self):
         """Navigate back to previous window in history"""
@@ -2671,13 +2811,13 @@ class SideEffectsWindow(ModuleWindow):
 
 
 
-class WhatsThisWindow(ModuleWindow):
+class WhatsThisWindow(PipelineNavigatorMixin, ModuleWindow):
     """Window for What's This? - entity information lookup with pipeline navigation"""
     
-    def __init__(self, module_name: str, parent_home_screen, initial_entity: str = None, came_from: list = None):
+    def __init__(self, module_name: str, parent_home_screen, initial_entity: str = None, came_from: tuple = None):
         self.initial_entity = initial_entity
         self.current_entity = None  # Store matched entity for pipeline navigation
-        self.came_from = came_from or []  # List of (WindowClass, entity_name) tuples for back navigation history
+        self.came_from = tuple(came_from or ())  # Immutable stack of (WindowClass, entity_name) pairs for back navigation history
         super().__init__(module_name, parent_home_screen)
         
         # If initial entity provided, auto-fill and search
@@ -2688,7 +2828,7 @@ class WhatsThisWindow(ModuleWindow):
     
     def setup_content(self):
         # Initialize MenuLLM for AI-powered responses
-        self.menu_llm = MenuLLM() if MENU_LLM_AVAILABLE else None
+        self.menu_llm = _get_menu_llm()
 
         from PySide6.QtWidgets import QLineEdit, QLabel, QHBoxLayout, QWidget
         
@@ -2815,11 +2955,11 @@ class WhatsThisWindow(ModuleWindow):
         """Show comprehensive information about the entity (synchronous - fast lookup)"""
         text = self.text_input.text().strip()
         if not text:
-            self.results_label.setText("⚠ï¸ Please enter an entity name first")
+            self._set_results("⚠ï¸ Please enter an entity name first")
             return
         
         self.next_step_btn.setVisible(False)
-        self.results_label.setText("⏳ Looking up information...")
+        self._set_results("⏳ Looking up information...")
         QApplication.processEvents()
         
         try:
@@ -2829,12 +2969,12 @@ class WhatsThisWindow(ModuleWindow):
             
             matched_name, suggestion = fuzzy_match_entity(text)
             if not matched_name:
-                self.results_label.setText(suggestion)
+                self._set_results(suggestion)
                 return
             
             entity = getEntity(matched_name)
             if not entity:
-                self.results_label.setText(f"❌ Could not find entity: {text}\n\nTry: Softgoal, Performance, Security, Indexing, etc.")
+                self._set_results(f"❌ Could not find entity: {text}\n\nTry: Softgoal, Performance, Security, Indexing, etc.")
                 return
             
             info = whatIs(entity, verbose=True)
@@ -2863,7 +3003,7 @@ class WhatsThisWindow(ModuleWindow):
             else:
                 final_response = suggestion + info
             
-            self.results_label.setText(final_response)
+            self._set_results(final_response)
             
             # Detect entity type: NFR vs Operationalization
             self.current_entity = matched_name
@@ -2890,44 +3030,26 @@ class WhatsThisWindow(ModuleWindow):
             self.next_step_btn.setVisible(True)
             
         except ImportError:
-            self.results_label.setText("❌ Error: nfr_queries.py not found\n\nMake sure the queries module is in the project directory.")
+            self._set_results("❌ Error: nfr_queries.py not found\n\nMake sure the queries module is in the project directory.")
         except Exception as e:
             import traceback
-            self.results_label.setText(f"❌ Error: {str(e)}\n\n{traceback.format_exc()}")
+            self._set_results(f"❌ Error: {str(e)}\n\n{traceback.format_exc()}")
     
     def go_to_decomposition(self):
         """Navigate to appropriate decomposition window based on entity type"""
         if self.current_entity:
-            # Clean up entity name for display (remove Type/Softgoal suffix)
-            clean_name = self.current_entity.replace('Type', '').replace('Softgoal', '')
-            
-            # Build navigation history - add current window to the stack
-            history = self.came_from + [('WhatsThisWindow', clean_name)]
-            
-            # Set flag to prevent homescreen from showing on close
-            self._navigating_pipeline = True
-            self.hide()
-            
             # Route to appropriate window based on entity type
             if getattr(self, 'is_operationalization', False):
                 # For operationalizations, go to Operationalization Decomposition / Side Effects
-                self.decomp_window = OperationalizationDecompositionWindow(
-                    "Operationalization Decompositions", 
-                    self.parent_home_screen,
-                    initial_entity=clean_name,
-                    came_from=history
+                self.decomp_window = self._navigate(
+                    OperationalizationDecompositionWindow, self.current_entity,
+                    "Operationalization Decompositions"
                 )
             else:
                 # For NFRs, go to NFR Decomposition
-                self.decomp_window = NFRDecompositionWindow(
-                    "NFR Decompositions", 
-                    self.parent_home_screen,
-                    initial_entity=clean_name,
-                    came_from=history
+                self.decomp_window = self._navigate(
+                    NFRDecompositionWindow, self.current_entity, "NFR Decompositions"
                 )
-            
-            self.decomp_window.show()
-            self.close()
     
     def go_back(self):
         """Navigate back to previous window in history"""
@@ -2967,14 +3089,14 @@ class WhatsThisWindow(ModuleWindow):
 # SPECIALIZED DECOMPOSITION WINDOWS
 # ============================================================================
 
-class NFRDecompositionWindow(ModuleWindow):
+class NFRDecompositionWindow(PipelineNavigatorMixin, ModuleWindow):
     """Window for NFR-to-NFR decompositions with pipeline navigation"""
     
-    def __init__(self, module_name: str, parent_home_screen, initial_entity: str = None, came_from: list = None):
+    def __init__(self, module_name: str, parent_home_screen, initial_entity: str = None, came_from: tuple = None):
         self.initial_entity = initial_entity
         self.current_entity = None
         self.current_offspring = []  # Store offspring for navigation
-        self.came_from = came_from or []  # List of (WindowClass, entity_name) tuples for back navigation history
+        self.came_from = tuple(came_from or ())  # Immutable stack of (WindowClass, entity_name) pairs for back navigation history
         super().__init__(module_name, parent_home_screen)
         
         # If initial entity provided, auto-fill and search
@@ -2985,7 +3107,7 @@ class NFRDecompositionWindow(ModuleWindow):
     
     def setup_content(self):
         # Initialize MenuLLM for AI-powered responses
-        self.menu_llm = MenuLLM() if MENU_LLM_AVAILABLE else None
+        self.menu_llm = _get_menu_llm()
 
         # Back button (if came from somewhere in pipeline)
         self.back_btn = QPushButton("â† Back")
@@ -3148,12 +3270,12 @@ class NFRDecompositionWindow(ModuleWindow):
         """Show NFR-to-NFR decompositions (synchronous - fast lookup)"""
         text = self.text_input.text().strip()
         if not text:
-            self.results_label.setText("⚠ï¸ Please enter an NFR type first")
+            self._set_results("⚠ï¸ Please enter an NFR type first")
             return
         
         self.next_step_btn.setVisible(False)
         self.claims_btn.setVisible(False)
-        self.results_label.setText("⏳ Searching for NFR decompositions...")
+        self._set_results("⏳ Searching for NFR decompositions...")
         QApplication.processEvents()
         
         try:
@@ -3163,7 +3285,7 @@ class NFRDecompositionWindow(ModuleWindow):
             # Fuzzy match
             matched_name, suggestion = fuzzy_match_entity(text)
             if not matched_name:
-                self.results_label.setText(suggestion)
+                self._set_results(suggestion)
                 return
             
             entity = getEntity(matched_name)
@@ -3173,15 +3295,12 @@ class NFRDecompositionWindow(ModuleWindow):
             all_decomps = getDecompositionsFor(entity)
             
             # Filter for NFRDecompositionMethod only
-            nfr_decomps = []
+            nfr_decomps = [d for d in all_decomps if d.kind == metamodel.MethodKind.NFR]
             all_offspring = []
-            for decomp in all_decomps:
-                if hasattr(metamodel, 'NFRDecompositionMethod'):
-                    if isinstance(decomp, metamodel.NFRDecompositionMethod):
-                        nfr_decomps.append(decomp)
-                        if hasattr(decomp, 'offspring') and decomp.offspring:
-                            for o in decomp.offspring:
-                                all_offspring.append(o.__name__)
+            for decomp in nfr_decomps:
+                if hasattr(decomp, 'offspring') and decomp.offspring:
+                    for o in decomp.offspring:
+                        all_offspring.append(o.__name__)
             
             response = suggestion
             formatted_name = format_entity_name(entity_name)
@@ -3196,7 +3315,7 @@ class NFRDecompositionWindow(ModuleWindow):
                     if hasattr(decomp, 'description') and decomp.description:
                         response += f"   🔝 {decomp.description}\n"
                     if hasattr(decomp, 'offspring') and decomp.offspring:
-                        offspring_names = [format_entity_name(o.__name__) for o in decomp.offspring]
+                        offspring_names = [_formatted(o.__name__) for o in decomp.offspring]
                         response += f"   🌿 Sub-NFRs: {', '.join(offspring_names)}\n"
                     response += "\n"
                 
@@ -3216,12 +3335,12 @@ class NFRDecompositionWindow(ModuleWindow):
                         user_input=text,
                         metamodel_context=response
                     )
-                    self.results_label.setText(llm_response)
+                    self._set_results(llm_response)
                 except Exception:
                     # Fallback to raw response on LLM error
-                    self.results_label.setText(response)
+                    self._set_results(response)
             else:
-                self.results_label.setText(response)
+                self._set_results(response)
             
             # Show pipeline button
             self.current_entity = matched_name
@@ -3235,47 +3354,22 @@ class NFRDecompositionWindow(ModuleWindow):
             
         except Exception as e:
             import traceback
-            self.results_label.setText(f"❌ Error: {str(e)}\n\n{traceback.format_exc()}")
+            self._set_results(f"❌ Error: {str(e)}\n\n{traceback.format_exc()}")
     
     def go_to_operationalization(self):
         """Navigate to Operationalization window with current entity"""
         if self.current_entity:
-            # Clean up entity name for display
-            clean_name = self.current_entity.replace('Type', '').replace('Softgoal', '')
-            
-            # Build navigation history
-            history = self.came_from + [('NFRDecompositionWindow', clean_name)]
-            
-            # Set flag to prevent homescreen from showing on close
-            self._navigating_pipeline = True
-            self.hide()
-            self.op_window = OperationalizationDecompositionWindow(
-                "Operationalization Decompositions", 
-                self.parent_home_screen,
-                initial_entity=clean_name,
-                came_from=history
+            self.op_window = self._navigate(
+                OperationalizationDecompositionWindow, self.current_entity,
+                "Operationalization Decompositions"
             )
-            self.op_window.show()
-            self.close()
     
     def go_to_claims(self):
         """Navigate to Claims/Argumentation window"""
         if self.current_entity:
-            clean_name = self.current_entity.replace('Type', '').replace('Softgoal', '')
-            
-            # Build navigation history
-            history = self.came_from + [('NFRDecompositionWindow', clean_name)]
-            
-            self._navigating_pipeline = True
-            self.hide()
-            self.claims_window = AttributionWindow(
-                "What is the justification? (Claim)", 
-                self.parent_home_screen,
-                initial_entity=clean_name,
-                came_from=history
+            self.claims_window = self._navigate(
+                AttributionWindow, self.current_entity, "What is the justification? (Claim)"
             )
-            self.claims_window.show()
-            self.close()
     
     def go_back(self):
         """Navigate back to previous window in history"""
@@ -3301,14 +3395,15 @@ class NFRDecompositionWindow(ModuleWindow):
             self.back_window.show()
             self.close()
 
-class OperationalizationDecompositionWindow(ModuleWindow):
+class OperationalizationDecompositionWindow(PipelineNavigatorMixin, ModuleWindow):
     """Window for operationalization decompositions with pipeline navigation"""
     
-    def __init__(self, module_name: str, parent_home_screen, initial_entity: str = None, came_from: list = None):
+    def __init__(self, module_name: str, parent_home_screen, initial_entity: str = None, came_from: tuple = None):
         self.initial_entity = initial_entity
         self.current_entity = None
         self.found_operationalizations = []  # Store ops for side effects navigation
-        self.came_from = came_from or []  # List of (WindowClass, entity_name) tuples for back navigation history
+        self._search_seq = 0  # Bumped per search so a late, older result is dropped
+        self.came_from = tuple(came_from or ())  # Immutable stack of (WindowClass, entity_name) pairs for back navigation history
         super().__init__(module_name, parent_home_screen)
         
         if self.initial_entity:
@@ -3318,7 +3413,7 @@ class OperationalizationDecompositionWindow(ModuleWindow):
     
     def setup_content(self):
         # Initialize MenuLLM for AI-powered responses
-        self.menu_llm = MenuLLM() if MENU_LLM_AVAILABLE else None
+        self.menu_llm = _get_menu_llm()
 
         from PySide6.QtWidgets import QComboBox, QHBoxLayout, QWidget
         
@@ -3529,220 +3624,242 @@ class OperationalizationDecompositionWindow(ModuleWindow):
         self.content_layout.addWidget(self.claims_btn)
     
     def show_op_details(self):
-        """Bidirectional: NFRâ†’Operationalizations OR Operationalizationâ†’Types & contributions (synchronous)"""
+        """Bidirectional: NFRâ†’Operationalizations OR Operationalizationâ†’Types & contributions (threaded)"""
         text = self.text_input.text().strip()
         if not text:
-            self.results_label.setText("⚠ï¸ Please enter an NFR or operationalization")
+            self._set_results("⚠ï¸ Please enter an NFR or operationalization")
             return
         
         self.pipeline_container.setVisible(False)
         self.claims_btn.setVisible(False)
-        self.results_label.setText("⏳ Searching...")
+        self._set_results("⏳ Searching...")
         QApplication.processEvents()
+        self._search_seq += 1
+        seq = self._search_seq
         
-        try:
-            from nfr_queries import getEntity, getDecompositionsFor, getEntityName, getChildren
-            import metamodel
-            import inspect
-            
-            # Fuzzy match
-            matched_name, suggestion = fuzzy_match_entity(text)
-            if not matched_name:
-                self.results_label.setText(suggestion)
-                return
-            
-            entity = getEntity(matched_name)
-            entity_name = getEntityName(entity)
-            formatted_name = format_entity_name(entity_name)
-            search_name = entity_name.replace('Type', '').replace('Softgoal', '')
-            
-            # Determine if it's an NFR or Operationalization
-            is_nfr = False
-            
-            if inspect.isclass(entity):
-                try:
-                    if hasattr(metamodel, 'NFRSoftgoalType'):
-                        if issubclass(entity, metamodel.NFRSoftgoalType):
-                            is_nfr = True
-                    
-                    if is_nfr and hasattr(metamodel, 'OperationalizingSoftgoalType'):
-                        if issubclass(entity, metamodel.OperationalizingSoftgoalType):
-                            is_nfr = False
-                    elif is_nfr and hasattr(metamodel, 'OperationalizingType'):
-                        if issubclass(entity, metamodel.OperationalizingType):
-                            is_nfr = False
-                except TypeError:
-                    pass
-            
-            response = suggestion
-            found_ops = []
-            
-            # CASE 1: Input is an NFR â†’ Show operationalizations that help it
-            if is_nfr:
-                response += f"🎯 How to achieve {formatted_name}\n\n"
-                response += "=" * 60 + "\n\n"
-                
-                search_targets = [search_name]
+        def do_search():
+            """Walk the metamodel and call the LLM; returns (text, matched_name, found_ops)"""
+            try:
+                from nfr_queries import getEntity, getDecompositionsFor, getEntityName, getChildren, _contrib_index
+                import metamodel
+                import inspect
                 
-                try:
-                    children = getChildren(entity)
-                    for child in children:
-                        child_name = getEntityName(child).replace('Type', '').replace('Softgoal', '')
-                        if child_name not in search_targets:
-                            search_targets.append(child_name)
-                except:
-                    pass
+                # Fuzzy match
+                matched_name, suggestion = fuzzy_match_entity(text)
+                if not matched_name:
+                    return suggestion, None, []
                 
-                try:
-                    decomps = getDecompositionsFor(entity)
-                    for decomp in decomps:
-                        if hasattr(decomp, 'offspring'):
-                            for offspring in decomp.offspring:
-                                offspring_name = getEntityName(offspring).replace('Type', '').replace('Softgoal', '')
-                                if offspring_name not in search_targets:
-                                    search_targets.append(offspring_name)
-                except:
-                    pass
+                entity = getEntity(matched_name)
+                entity_name = getEntityName(entity)
+                formatted_name = format_entity_name(entity_name)
+                search_name = _clean_entity_name(entity_name)
                 
-                # STRATEGY: Include operationalizations with at least one positive contribution,
-                # but show ALL their contributions (positive and negative) for complete context
-                positive_types = ['MAKE', 'HELP', 'SOME+']
+                # Determine if it's an NFR or Operationalization
+                is_nfr = False
                 
-                # Step 1: Find operationalizations that have at least one positive contribution
-                ops_with_positive = set()
-                all_contributions = []
+                if inspect.isclass(entity):
+                    try:
+                        if hasattr(metamodel, 'NFRSoftgoalType'):
+                            if issubclass(entity, metamodel.NFRSoftgoalType):
+                                is_nfr = True
+                        
+                        if is_nfr and hasattr(metamodel, 'OperationalizingSoftgoalType'):
+                            if issubclass(entity, metamodel.OperationalizingSoftgoalType):
+                                is_nfr = False
+                        elif is_nfr and hasattr(metamodel, 'OperationalizingType'):
+                            if issubclass(entity, metamodel.OperationalizingType):
+                                is_nfr = False
+                    except TypeError:
+                        pass
                 
-                for name, obj in inspect.getmembers(metamodel):
-                    if isinstance(obj, metamodel.Contribution):
-                        target_match = any(obj.target.lower() == t.lower() for t in search_targets)
-                        if target_match:
-                            all_contributions.append((obj.source, obj.target, obj.type.value))
-                            # Track if this operationalization has at least one positive
-                            if obj.type.value in positive_types:
-                                ops_with_positive.add(obj.source)
+                parts = [suggestion]
+                found_ops = []
                 
-                # Step 2: Include ALL contributions from operationalizations that have at least one positive
-                contributions = []
-                for source, target, effect in all_contributions:
-                    if source in ops_with_positive:
-                        contributions.append((source, target, effect))
-                        if source not in found_ops:
-                            found_ops.append(source)
+                # CASE 1: Input is an NFR â†’ Show operationalizations that help it
+                if is_nfr:
+                    parts.append(f"🎯 How to achieve {formatted_name}\n\n")
+                    parts.append("=" * 60 + "\n\n")
+                    
+                    search_targets = [search_name]
+                    
+                    try:
+                        children = getChildren(entity)
+                        for child in children:
+                            child_name = _clean_entity_name(getEntityName(child))
+                            if child_name not in search_targets:
+                                search_targets.append(child_name)
+                    except:
+                        pass
+                    
+                    try:
+                        decomps = getDecompositionsFor(entity)
+                        for decomp in decomps:
+                            if hasattr(decomp, 'offspring'):
+                                for offspring in decomp.offspring:
+                                    offspring_name = _clean_entity_name(getEntityName(offspring))
+                                    if offspring_name not in search_targets:
+                                        search_targets.append(offspring_name)
+                    except:
+                        pass
+                    
+                    # STRATEGY: Include operationalizations with at least one positive contribution,
+                    # but show ALL their contributions (positive and negative) for complete context
+                    positive_types = ['MAKE', 'HELP', 'SOME+']
+                    
+                    # Step 1: Find operationalizations that have at least one positive contribution
+                    ops_with_positive = set()
+                    all_contributions = []
+                    
+                    for name, obj in sorted(vars(metamodel).items()):
+                        if isinstance(obj, metamodel.Contribution):
+                            target_match = any(obj.target.lower() == t.lower() for t in search_targets)
+                            if target_match:
+                                all_contributions.append((obj.source, obj.target, obj.type.value))
+                                # Track if this operationalization has at least one positive
+                                if obj.type.value in positive_types:
+                                    ops_with_positive.add(obj.source)
+                    
+                    # Step 2: Include ALL contributions from operationalizations that have at least one positive
+                    contributions = []
+                    for source, target, effect in all_contributions:
+                        if source in ops_with_positive:
+                            contributions.append((source, target, effect))
+                            if source not in found_ops:
+                                found_ops.append(source)
+                    
+                    if contributions:
+                        parts.append(f"Found {len(contributions)} operationalization(s):\n\n")
+                        
+                        from collections import defaultdict
+                        by_source = defaultdict(list)
+                        for source, target, effect in contributions:
+                            by_source[source].append((target, effect))
+                        
+                        for source in sorted(by_source.keys()):
+                            formatted_source = format_entity_name(source)
+                            parts.append(f"{formatted_source} helps achieve:\n\n")
+                            
+                            for target, effect in by_source[source]:
+                                formatted_target = format_entity_name(target)
+                                parts.append(f"   • {formatted_target} ({effect})\n")
+                            parts.append("\n")
+                        
+                        parts.append("=" * 60 + "\n")
+                        parts.append("\n💡 These techniques can help satisfy this NFR.")
+                    else:
+                        parts.append(f"â„¹ï¸ No operationalizations found for {formatted_name}.\n\n")
+                        parts.append("Try: Indexingâ†’Performance, Encryptionâ†’Security, etc.")
                 
-                if contributions:
-                    response += f"Found {len(contributions)} operationalization(s):\n\n"
+                # CASE 2: Input is an Operationalization â†’ Show types & NFRs it helps
+                else:
+                    found_ops.append(search_name)
+                    parts.append(f"✅ Details for {formatted_name}\n\n")
+                    parts.append("=" * 60 + "\n\n")
                     
-                    from collections import defaultdict
-                    by_source = defaultdict(list)
-                    for source, target, effect in contributions:
-                        by_source[source].append((target, effect))
+                    # Types & Decompositions
+                    subclasses = []
+                    try:
+                        children = getChildren(entity)
+                        if children:
+                            subclasses = [format_entity_name(getEntityName(child)) for child in children]
+                    except:
+                        pass
                     
-                    for source in sorted(by_source.keys()):
-                        formatted_source = format_entity_name(source)
-                        response += f"{formatted_source} helps achieve:\n\n"
+                    all_decomps = getDecompositionsFor(entity)
+                    op_decomps = [d for d in all_decomps if d.kind == metamodel.MethodKind.OPERATIONALIZATION]
+                    
+                    if subclasses or op_decomps:
+                        parts.append(f"🔧 TYPES & DECOMPOSITIONS\n\n")
                         
-                        for target, effect in by_source[source]:
-                            formatted_target = format_entity_name(target)
-                            response += f"   • {formatted_target} ({effect})\n"
-                        response += "\n"
+                        if subclasses:
+                            parts.append(f"📌 **Types of {formatted_name}** (via isA):\n")
+                            for subclass in subclasses:
+                                parts.append(f"   • {subclass}\n")
+                            parts.append("\n")
+                        
+                        if op_decomps:
+                            parts.append(f"🌳 **Decomposition Methods**:\n")
+                            for i, decomp in enumerate(op_decomps, 1):
+                                parts.append(f"   {i}. {decomp.name}\n")
+                                if hasattr(decomp, 'offspring') and decomp.offspring:
+                                    offspring_names = [_formatted(o.__name__) for o in decomp.offspring]
+                                    parts.append(f"      â””â”€ {', '.join(offspring_names)}\n")
+                            parts.append("\n")
+                    else:
+                        parts.append(f"🔧 No subclasses or decompositions found.\n\n")
                     
-                    response += "=" * 60 + "\n"
-                    response += "\n💡 These techniques can help satisfy this NFR."
-                else:
-                    response += f"â„¹ï¸ No operationalizations found for {formatted_name}.\n\n"
-                    response += "Try: Indexingâ†’Performance, Encryptionâ†’Security, etc."
-            
-            # CASE 2: Input is an Operationalization â†’ Show types & NFRs it helps
-            else:
-                found_ops.append(search_name)
-                response += f"✅ Details for {formatted_name}\n\n"
-                response += "=" * 60 + "\n\n"
-                
-                # Types & Decompositions
-                subclasses = []
-                try:
-                    children = getChildren(entity)
-                    if children:
-                        subclasses = [format_entity_name(getEntityName(child)) for child in children]
-                except:
-                    pass
-                
-                all_decomps = getDecompositionsFor(entity)
-                op_decomps = []
-                for decomp in all_decomps:
-                    if hasattr(metamodel, 'OperationalizationDecompositionMethod'):
-                        if isinstance(decomp, metamodel.OperationalizationDecompositionMethod):
-                            op_decomps.append(decomp)
-                
-                if subclasses or op_decomps:
-                    response += f"🔧 TYPES & DECOMPOSITIONS\n\n"
+                    # Positive Contributions
+                    parts.append("=" * 60 + "\n\n")
+                    parts.append(f"✅ POSITIVE CONTRIBUTIONS (NFRs this helps)\n\n")
                     
-                    if subclasses:
-                        response += f"📌 **Types of {formatted_name}** (via isA):\n"
-                        for subclass in subclasses:
-                            response += f"   • {subclass}\n"
-                        response += "\n"
+                    positive_contribs = []
+                    for obj in _contrib_index().get(search_name.lower(), ()):
+                        effect = obj.type.value
+                        if effect in _POSITIVE:
+                            positive_contribs.append((_formatted(obj.target), effect))
                     
-                    if op_decomps:
-                        response += f"🌳 **Decomposition Methods**:\n"
-                        for i, decomp in enumerate(op_decomps, 1):
-                            response += f"   {i}. {decomp.name}\n"
-                            if hasattr(decomp, 'offspring') and decomp.offspring:
-                                offspring_names = [format_entity_name(o.__name__) for o in decomp.offspring]
-                                response += f"      â””â”€ {', '.join(offspring_names)}\n"
-                        response += "\n"
-                else:
-                    response += f"🔧 No subclasses or decompositions found.\n\n"
+                    if positive_contribs:
+                        parts.append(f"{formatted_name} helps achieve:\n\n")
+                        for target, effect in positive_contribs:
+                            parts.append(f"   • {target} ({effect})\n")
+                        parts.append("\n")
+                    else:
+                        parts.append(f"No positive contributions defined for {formatted_name}.\n")
+                        parts.append(f"This might mean it's not in the metamodel yet.\n\n")
+                    
+                    parts.append("=" * 60 + "\n")
+                    parts.append(f"\n💡 Select an operationalization below to see its side effects.")
                 
-                # Positive Contributions
-                response += "=" * 60 + "\n\n"
-                response += f"✅ POSITIVE CONTRIBUTIONS (NFRs this helps)\n\n"
+                response = "".join(parts)
                 
-                positive_contribs = []
-                for name, obj in inspect.getmembers(metamodel):
-                    if isinstance(obj, metamodel.Contribution):
-                        if obj.source.lower() == search_name.lower():
-                            if obj.type.value in ['HELP', 'MAKE']:
-                                formatted_target = format_entity_name(obj.target)
-                                positive_contribs.append((formatted_target, obj.type.value))
+                # Pass through MenuLLM for natural language response
+                if self.menu_llm:
+                    try:
+                        response = self.menu_llm.respond(
+                            action_type="show_operationalizations" if is_nfr else "analyze_contributions",
+                            user_input=text,
+                            metamodel_context=response
+                        )
+                    except Exception:
+                        # Fallback to raw response on LLM error
+                        pass
                 
-                if positive_contribs:
-                    response += f"{formatted_name} helps achieve:\n\n"
-                    for target, effect in positive_contribs:
-                        response += f"   • {target} ({effect})\n"
-                    response += "\n"
-                else:
-                    response += f"No positive contributions defined for {formatted_name}.\n"
-                    response += f"This might mean it's not in the metamodel yet.\n\n"
+                return response, matched_name, found_ops
                 
-                response += "=" * 60 + "\n"
-                response += f"\n💡 Select an operationalization below to see its side effects."
-            
-            # Update UI - pass through MenuLLM for natural language response
-            if self.menu_llm:
-                try:
-                    llm_response = self.menu_llm.respond(
-                        action_type="show_operationalizations" if is_nfr else "analyze_contributions",
-                        user_input=text,
-                        metamodel_context=response
-                    )
-                    self.results_label.setText(llm_response)
-                except Exception:
-                    # Fallback to raw response on LLM error
-                    self.results_label.setText(response)
-            else:
-                self.results_label.setText(response)
+            except Exception as e:
+                import traceback
+                return f"❌ Error: {str(e)}\n\n{traceback.format_exc()}", None, []
+        
+        # Run on the shared thread pool; the result travels with the queued signal
+        QThreadPool.globalInstance().start(
+            _SearchRunnable(lambda: (seq, *do_search()), self._apply_search_result))
+    
+    @Slot(object)
+    def _apply_search_result(self, outcome):
+        """Apply all UI updates for a finished search in one event-loop tick"""
+        seq, result, matched_name, found_ops = outcome
+        if seq != self._search_seq:
+            return  # A newer search has started since this one
+        
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            self._set_results(result)
+            if not matched_name:
+                return
             
             # Show pipeline controls if we found operationalizations
             if found_ops:
                 self.current_entity = matched_name
-                self.found_operationalizations = found_ops
+                self.found_operationalizations = list(found_ops)
                 
-                # Populate dropdown with operationalizations
-                self.op_dropdown.clear()
-                for op in found_ops:
-                    formatted_op = format_entity_name(op)
-                    self.op_dropdown.addItem(f"⚡ {formatted_op}", op)
+                # Populate dropdown in one batch; found_operationalizations maps
+                # each row index back to its operationalization
+                self.op_dropdown.blockSignals(True)
+                try:
+                    self.op_dropdown.clear()
+                    self.op_dropdown.addItems([f"⚡ {_formatted(op)}" for op in found_ops])
+                finally:
+                    self.op_dropdown.blockSignals(False)
                 
                 self.pipeline_container.setVisible(True)
             else:
@@ -3750,53 +3867,34 @@ class OperationalizationDecompositionWindow(ModuleWindow):
             
             # Always show claims button if entity was found
             self.claims_btn.setVisible(True)
-                
-        except Exception as e:
-            import traceback
-            self.results_label.setText(f"❌ Error: {str(e)}\n\n{traceback.format_exc()}")
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
+    
+    def reset_state(self):
+        """Also forget the found operationalizations and any search still running"""
+        super().reset_state()
+        self.found_operationalizations = []
+        self._search_seq += 1
     
     def go_to_side_effects(self):
         """Navigate to Side Effects window with selected operationalization"""
         # Get selected operationalization from dropdown
-        selected_op = self.op_dropdown.currentData()
+        index = self.op_dropdown.currentIndex()
+        selected_op = self.found_operationalizations[index] if 0 <= index < len(self.found_operationalizations) else None
         if selected_op:
-            clean_name = selected_op.replace('Type', '').replace('Softgoal', '')
             # Store the NFR we came from for back navigation
-            nfr_name = self.current_entity.replace('Type', '').replace('Softgoal', '') if self.current_entity else clean_name
-            
-            # Build navigation history
-            history = self.came_from + [('OperationalizationDecompositionWindow', nfr_name)]
-            
-            # Set flag to prevent homescreen from showing on close
-            self._navigating_pipeline = True
-            self.hide()
-            self.side_effects_window = SideEffectsWindow(
-                "Possible side effects? (Contributions)", 
-                self.parent_home_screen,
-                initial_entity=clean_name,
-                came_from=history
+            nfr_name = _clean_entity_name(self.current_entity)
+            self.side_effects_window = self._navigate(
+                SideEffectsWindow, selected_op, "Possible side effects? (Contributions)",
+                history_entity=nfr_name
             )
-            self.side_effects_window.show()
-            self.close()
     
     def go_to_claims(self):
         """Navigate to Claims/Argumentation window"""
         if self.current_entity:
-            clean_name = self.current_entity.replace('Type', '').replace('Softgoal', '')
-            
-            # Build navigation history
-            history = self.came_from + [('OperationalizationDecompositionWindow', clean_name)]
-            
-            self._navigating_pipeline = True
-            self.hide()
-            self.claims_window = AttributionWindow(
-                "What is the justification? (Claim)", 
-                self.parent_home_screen,
-                initial_entity=clean_name,
-                came_from=history
+            self.claims_window = self._navigate(
+                AttributionWindow, self.current_entity, "What is the justification? (Claim)"
             )
-            self.claims_window.show()
-            self.close()
     
     def go_back(self):
         """Navigate back to previous window in history"""
@@ -3845,7 +3943,7 @@ class ArgumentationDecompositionWindow(ModuleWindow):
     
     def setup_content(self):
         # Initialize MenuLLM for AI-powered responses
-        self.menu_llm = MenuLLM() if MENU_LLM_AVAILABLE else None
+        self.menu_llm = _get_menu_llm()
 
         # Title
         title = QLabel("Argumentation / Claim Decompositions")
@@ -3932,80 +4030,70 @@ class ArgumentationDecompositionWindow(ModuleWindow):
         """Show claims/justifications for decompositions"""
         text = self.text_input.text().strip()
         if not text:
-            self.results_label.setText("⚠ï¸ Please enter an NFR type first")
+            self._set_results("⚠ï¸ Please enter an NFR type first")
             return
         
-        self.results_label.setText("⏳ Searching for claims and justifications...")
+        self._set_results("⏳ Searching for claims and justifications...")
         QApplication.processEvents()
         
         def do_search():
             try:
-                from nfr_queries import getEntity, getDecompositionsFor, getEntityName
-                import metamodel
+                from nfr_queries import getEntityName, _decomps_for
                 
                 # Fuzzy match
                 matched_name, suggestion = fuzzy_match_entity(text)
                 if not matched_name:
                     return suggestion
                 
-                entity = getEntity(matched_name)
+                # Claim and NFR decompositions, split once per entity
+                entity, claim_decomps, nfr_decomps = _decomps_for(matched_name)
                 entity_name = getEntityName(entity)
                 formatted_name = format_entity_name(entity_name)
                 
-                # Get all decompositions
-                all_decomps = getDecompositionsFor(entity)
-                
-                # Filter for ClaimDecompositionMethod
-                claim_decomps = []
-                for decomp in all_decomps:
-                    if hasattr(metamodel, 'ClaimDecompositionMethod'):
-                        if isinstance(decomp, metamodel.ClaimDecompositionMethod):
-                            claim_decomps.append(decomp)
-                
-                response = suggestion
-                response += f"✅ **Argumentation for {formatted_name} Decompositions**\n\n"
-                response += "="*60 + "\n\n"
+                parts = [suggestion]
+                parts.append(f"✅ **Argumentation for {formatted_name} Decompositions**\n\n")
+                parts.append("="*60 + "\n\n")
                 
                 if claim_decomps:
-                    response += f"Found {len(claim_decomps)} claim/justification(s):\n\n"
+                    parts.append(f"Found {len(claim_decomps)} claim/justification(s):\n\n")
                     
                     for i, claim in enumerate(claim_decomps, 1):
-                        response += f"**ðŸ“š Claim {i}: {claim.name}**\n\n"
+                        parts.append(f"**ðŸ“š Claim {i}: {claim.name}**\n\n")
                         
                         
                         # Source (from claim argument)
                         if hasattr(claim, 'argument') and claim.argument:
-                            response += f"   **Source**: {claim.argument}\n\n"
+                            parts.append(f"   **Source**: {claim.argument}\n\n")
                         
                         # What it decomposes into
                         if hasattr(claim, 'offspring') and claim.offspring:
-                            offspring_names = [format_entity_name(o.__name__) for o in claim.offspring]
-                            response += f"   **Decomposes into**: {', '.join(offspring_names)}\n\n"
+                            offspring_names = [_formatted(o.__name__) for o in claim.offspring]
+                            parts.append(f"   **Decomposes into**: {', '.join(offspring_names)}\n\n")
                         
-                        response += "   " + "-"*50 + "\n\n"
+                        parts.append("   " + "-"*50 + "\n\n")
                     
-                    response += "="*60 + "\n"
-                    response += f"\n💡 **Interpretation**: Each claim above represents a scholarly perspective on how {formatted_name} should be decomposed."
+                    parts.append("="*60 + "\n")
+                    parts.append(f"\n💡 **Interpretation**: Each claim above represents a scholarly perspective on how {formatted_name} should be decomposed.")
                 else:
                     # Even if no claim decompositions, show NFR decompositions with attribution info
-                    nfr_decomps = [d for d in all_decomps if hasattr(metamodel, 'NFRDecompositionMethod') and isinstance(d, metamodel.NFRDecompositionMethod)]
-                    
                     if nfr_decomps:
-                        response += f"No explicit claim decompositions found.\n\n"
-                        response += f"However, {formatted_name} has {len(nfr_decomps)} NFR decomposition(s):\n\n"
+                        parts.append(f"No explicit claim decompositions found.\n\n")
+                        parts.append(f"However, {formatted_name} has {len(nfr_decomps)} NFR decomposition(s):\n\n")
                         
                         for i, decomp in enumerate(nfr_decomps, 1):
-                            response += f"**{i}. {decomp.name}**\n"
+                            parts.append(f"**{i}. {decomp.name}**\n")
                             if hasattr(decomp, 'description'):
-                                response += f"   {decomp.description}\n"
+                                parts.append(f"   {decomp.description}\n")
                             if hasattr(decomp, 'offspring'):
-                                offspring_names = [format_entity_name(o.__name__) for o in decomp.offspring]
-                                response += f"   â””â”€ {', '.join(offspring_names)}\n"
-                            response += "\n"
+                                offspring_names = [_formatted(o.__name__) for o in decomp.offspring]
+                                parts.append(f"   â””â”€ {', '.join(offspring_names)}\n")
+                            parts.append("\n")
                         
-                        response += "\n⚠ï¸ **Note**: Add source attribution for these decompositions in the metamodel for full argumentation support."
+                        parts.append("\n⚠ï¸ **Note**: Add source attribution for these decompositions in the metamodel for full argumentation support.")
                     else:
-                        response += f"â„¹ï¸ No decomposition methods (claim or NFR) found for {formatted_name}."
+                        parts.append(f"â„¹ï¸ No decomposition methods (claim or NFR) found for {formatted_name}.")
+                
+                response = "".join(parts)
                 
                 # Pass through MenuLLM
                 if hasattr(self, "menu_llm") and self.menu_llm:
@@ -4021,15 +4109,106 @@ class ArgumentationDecompositionWindow(ModuleWindow):
                 import traceback
                 return f"❌ Error: {str(e)}\n\n{traceback.format_exc()}"
         
-        # Run in thread
-        def run_and_update():
-            result = do_search()
-            QMetaObject.invokeMethod(self.results_label, "setText", 
-                                    Qt.QueuedConnection, Q_ARG(str, result))
-        
-        thread = threading.Thread(target=run_and_update, daemon=True)
-        thread.start()
+        # Run on the shared thread pool; the result is delivered via a queued signal
+        QThreadPool.globalInstance().start(_SearchRunnable(do_search, self._set_results))
+
+
+
+# Common words to ignore when picking entity names out of a statement
+_VERIFY_IGNORE_WORDS = frozenset({
+    'is', 'an', 'are', 'the', 'a', 'into', 'and', 'or', 'to', 'for',
+    'of', 'in', 'on', 'with', 'by', 'from', 'as', 'at', 'nfr', 'fr',
+    'decomposed', 'operationalization', 'contributes', 'affects'
+})
+
 
+def _statement_tokens(statement: str) -> tuple:
+    """Lowercased candidate entity words in a statement (longer, non-stop words), in order, de-duplicated"""
+    words = statement.replace(',', ' ').replace('.', ' ').split()
+    return tuple(dict.fromkeys(
+        w.lower() for w in words if len(w) > 3 and w.lower() not in _VERIFY_IGNORE_WORDS
+    ))
+
+
+@functools.lru_cache(maxsize=256)
+def _build_metamodel_context_cached(tokens: tuple) -> str:
+    """Build verification context for the candidate words of a statement (cached per word tuple)"""
+    from itertools import islice
+    from nfr_queries import (
+        getAllNFRTypesIter, getAllOperationalizingTypesIter, _nfr_count, _op_count,
+        getEntity, getDecompositionsFor, getEntityName, format_entity_name
+    )
+    from metamodel import NFRSoftgoalType, OperationalizingSoftgoalType
+    
+    context = "METAMODEL INFORMATION FOR VERIFICATION:\n\n"
+    
+    # Statement order, so matched entities appear as they do in the statement
+    potential_entities = tokens
+    
+    # Try to find matching entities in metamodel - exact names first
+    names = _all_entity_names_lower()
+    found_entities = []
+    for potential_name in potential_entities:
+        try:
+            if potential_name in names:
+                matched_name = names[potential_name]
+            else:
+                # Fall back to fuzzy matching
+                matched_name, _ = fuzzy_match_entity(potential_name)
+            if matched_name:
+                entity = getEntity(matched_name)
+                found_entities.append((matched_name, entity))
+        except:
+            pass
+    
+    # Add information about found entities
+    for entity_name, entity in found_entities:
+        context += f"\n--- {format_entity_name(entity_name)} ---\n"
+        
+        # Check type
+        if isinstance(entity, type) and issubclass(entity, NFRSoftgoalType):
+            context += "Type: NFR Type\n"
+        elif isinstance(entity, type) and issubclass(entity, OperationalizingSoftgoalType):
+            context += "Type: Operationalizing Softgoal (Operationalization)\n"
+        
+        # Get decompositions
+        try:
+            decomps = getDecompositionsFor(entity)
+            if decomps:
+                context += "Decomposition Methods:\n"
+                for decomp in decomps:
+                    context += f"  - {decomp.name}\n"
+                    if hasattr(decomp, 'offspring'):
+                        offspring_names = [_formatted(o.__name__) for o in decomp.offspring]
+                        context += f"    Offspring: {', '.join(offspring_names)}\n"
+        except:
+            pass
+    
+    # Add summary of all NFR types
+    context += "\n--- ALL NFR TYPES IN METAMODEL ---\n"
+    try:
+        preview = list(islice(getAllNFRTypesIter(), 20))  # First 20
+        context += ", ".join(preview)
+        total = _nfr_count()
+        if total > 20:
+            context += f", ... ({total} total)"
+        context += "\n"
+    except:
+        pass
+    
+    # Add summary of operationalizations
+    context += "\n--- ALL OPERATIONALIZATIONS IN METAMODEL ---\n"
+    try:
+        op_names = [format_entity_name(op) for op in islice(getAllOperationalizingTypesIter(), 15)]  # First 15
+        context += ", ".join(op_names)
+        total = _op_count()
+        if total > 15:
+            context += f", ... ({total} total)"
+        context += "\n"
+    except:
+        pass
+    
+    return context
 
 
 class VerificationWindow(ModuleWindow):
@@ -4037,7 +4216,7 @@ class VerificationWindow(ModuleWindow):
     
     def setup_content(self):
         # Initialize MenuLLM for AI-powered parsing
-        self.menu_llm = MenuLLM() if MENU_LLM_AVAILABLE else None
+        self.menu_llm = _get_menu_llm()
 
         from PySide6.QtWidgets import QLineEdit, QLabel, QTextEdit
         
@@ -4116,93 +4295,17 @@ class VerificationWindow(ModuleWindow):
     
     def _build_metamodel_context(self, statement):
         """Build metamodel context to help LLM verify the statement"""
-        from nfr_queries import (
-            getAllNFRTypes, getAllOperationalizingTypes,
-            getEntity, getDecompositionsFor, getEntityName, format_entity_name
-        )
-        from metamodel import NFRSoftgoalType, OperationalizingSoftgoalType
-        
-        context = "METAMODEL INFORMATION FOR VERIFICATION:\n\n"
-        
-        # Extract potential entity names (simple word extraction)
-        words = statement.replace(',', ' ').replace('.', ' ').split()
-        # Common words to ignore
-        ignore_words = {'is', 'an', 'are', 'the', 'a', 'into', 'and', 'or', 'to', 'for', 
-                       'of', 'in', 'on', 'with', 'by', 'from', 'as', 'at', 'nfr', 'fr',
-                       'decomposed', 'operationalization', 'contributes', 'affects'}
-        
-        # Get potential entity names (capitalized words or longer words)
-        potential_entities = [w for w in words if len(w) > 3 and w.lower() not in ignore_words]
-        
-        # Try to find matching entities in metamodel
-        found_entities = []
-        for potential_name in potential_entities:
-            try:
-                # Try fuzzy matching
-                matched_name, _ = fuzzy_match_entity(potential_name)
-                if matched_name:
-                    entity = getEntity(matched_name)
-                    found_entities.append((matched_name, entity))
-            except:
-                pass
-        
-        # Add information about found entities
-        for entity_name, entity in found_entities:
-            context += f"\n--- {format_entity_name(entity_name)} ---\n"
-            
-            # Check type
-            if isinstance(entity, type) and issubclass(entity, NFRSoftgoalType):
-                context += "Type: NFR Type\n"
-            elif isinstance(entity, type) and issubclass(entity, OperationalizingSoftgoalType):
-                context += "Type: Operationalizing Softgoal (Operationalization)\n"
-            
-            # Get decompositions
-            try:
-                decomps = getDecompositionsFor(entity)
-                if decomps:
-                    context += "Decomposition Methods:\n"
-                    for decomp in decomps:
-                        context += f"  - {decomp.name}\n"
-                        if hasattr(decomp, 'offspring'):
-                            offspring_names = [format_entity_name(o.__name__) for o in decomp.offspring]
-                            context += f"    Offspring: {', '.join(offspring_names)}\n"
-            except:
-                pass
-        
-        # Add summary of all NFR types
-        context += "\n--- ALL NFR TYPES IN METAMODEL ---\n"
-        try:
-            all_nfrs = getAllNFRTypes()  # Returns list of string names
-            context += ", ".join(all_nfrs[:20])  # First 20
-            if len(all_nfrs) > 20:
-                context += f", ... ({len(all_nfrs)} total)"
-            context += "\n"
-        except:
-            pass
-        
-        # Add summary of operationalizations
-        context += "\n--- ALL OPERATIONALIZATIONS IN METAMODEL ---\n"
-        try:
-            all_ops = getAllOperationalizingTypes()
-            op_names = [format_entity_name(op) for op in all_ops]
-            context += ", ".join(op_names[:15])  # First 15
-            if len(op_names) > 15:
-                context += f", ... ({len(op_names)} total)"
-            context += "\n"
-        except:
-            pass
-        
-        return context
+        return _build_metamodel_context_cached(_statement_tokens(statement))
     
     def verify_statement(self):
         """Verify the natural language statement against the metamodel"""
         text = self.text_input.toPlainText().strip()
         if not text:
-            self.results_label.setText("⚠️ Please enter a statement to verify")
+            self._set_results("⚠️ Please enter a statement to verify")
             return
         
         # Show loading
-        self.results_label.setText("⏳ Analyzing your statement against the metamodel...")
+        self._set_results("⏳ Analyzing your statement against the metamodel...")
         QApplication.processEvents()
         
         try:
@@ -4216,14 +4319,24 @@ class VerificationWindow(ModuleWindow):
                     user_input=text,
                     metamodel_context=context
                 )
-                self.results_label.setText(result)
+                self._set_results(result)
             else:
-                self.results_label.setText("❌ LLM not available. Cannot parse natural language statements.\n\nPlease ensure Ollama is running and a model is available.")
+                self._set_results("❌ LLM not available. Cannot parse natural language statements.\n\nPlease ensure Ollama is running and a model is available.")
                 
         except Exception as e:
             import traceback
-            self.results_label.setText(f"❌ Error during verification:\n\n{str(e)}\n\n{traceback.format_exc()}")
+            self._set_results(f"❌ Error during verification:\n\n{str(e)}\n\n{traceback.format_exc()}")
+
+
 
+# HTML for one chat message, and a one-pass escape table (also newline -> <br>)
+_CHAT_MSG_TEMPLATE = (
+    '<div style="margin-bottom: 15px;">'
+    '<b style="color: {color}; font-size: 14pt;">{sender}:</b><br>'
+    '<span style="color: #333; font-size: 13pt;">{message}</span>'
+    '</div>'
+)
+_HTML_ESC = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '\n': '<br>'})
 
 
 class ChatWindow(ModuleWindow):
@@ -4231,10 +4344,18 @@ class ChatWindow(ModuleWindow):
     
     def setup_content(self):
         # Initialize MenuLLM
-        self.menu_llm = MenuLLM() if MENU_LLM_AVAILABLE else None
-        self.chat_history = []  # Store conversation history
+        self.menu_llm = _get_menu_llm()
+        self.chat_history = deque(maxlen=1000)  # Store conversation history (bounded)
+        
+        # Pending message HTML, flushed to the display at most every 30 ms
+        self._pending = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(30)
+        self._flush_timer.timeout.connect(self._flush_chat)
+        self._thinking_cursor = None
 
-        from PySide6.QtWidgets import QTextEdit, QLabel, QVBoxLayout, QPushButton, QHBoxLayout
+        from PySide6.QtWidgets import QTextEdit, QPlainTextEdit, QLabel, QVBoxLayout, QPushButton, QHBoxLayout
         
         # Instruction label
         instruction = QLabel("Ask any question about the NFR Framework:")
@@ -4242,12 +4363,15 @@ class ChatWindow(ModuleWindow):
         self.content_layout.addWidget(instruction)
         
         # Chat display area - shows conversation history
-        self.chat_display = QTextEdit()
+        # (plain-text document with a block cap so old messages are pruned)
+        self.chat_display = QPlainTextEdit()
         self.chat_display.setReadOnly(True)
+        self.chat_display.setMaximumBlockCount(500)
+        self.chat_display.setUndoRedoEnabled(False)
         self.chat_display.setPlaceholderText("Your conversation will appear here...\n\nAsk questions like:\n  • What NFR types are in the framework?\n  • How does Performance relate to Time and Space?\n  • What operationalizations help with Security?")
         self.chat_display.setMinimumHeight(300)
         self.chat_display.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 font-size: 13pt;
                 padding: 20px;
                 background-color: #f5f5f5;
@@ -4307,6 +4431,7 @@ class ChatWindow(ModuleWindow):
         send_btn.setCursor(Qt.PointingHandCursor)
         send_btn.clicked.connect(self.send_message)
         button_layout.addWidget(send_btn, stretch=3)
+        self.send_btn = send_btn
         
         # Clear button
         clear_btn = QPushButton("🗑️ Clear Chat")
@@ -4331,6 +4456,7 @@ class ChatWindow(ModuleWindow):
         clear_btn.setCursor(Qt.PointingHandCursor)
         clear_btn.clicked.connect(self.clear_chat)
         button_layout.addWidget(clear_btn, stretch=1)
+        self.clear_btn = clear_btn
         
         self.content_layout.addLayout(button_layout)
     
@@ -4346,50 +4472,117 @@ class ChatWindow(ModuleWindow):
         # Clear input
         self.text_input.clear()
         
-        # Show thinking indicator
-        self.chat_display.append("\n💭 Claude is thinking...\n")
-        QApplication.processEvents()
+        if not self.menu_llm:
+            self.add_to_chat("System", "❌ LLM not available. Please ensure Ollama is running.", "#f44336")
+            return
         
-        try:
-            # Get AI response using MenuLLM
-            if self.menu_llm:
-                response = self.menu_llm.respond(
-                    action_type="default",
-                    user_input=user_message,
-                    metamodel_context="Free-form chat about the NFR Framework. Answer questions naturally and helpfully."
-                )
-                
-                # Remove thinking indicator and add response
-                current_text = self.chat_display.toPlainText()
-                if "💭 Claude is thinking..." in current_text:
-                    current_text = current_text.replace("\n💭 Claude is thinking...\n", "")
-                    self.chat_display.setPlainText(current_text)
-                
-                self.add_to_chat("Claude", response, "#4CAF50")
-            else:
-                self.add_to_chat("System", "❌ LLM not available. Please ensure Ollama is running.", "#f44336")
-                
-        except Exception as e:
-            self.add_to_chat("System", f"❌ Error: {str(e)}", "#f44336")
+        # Show thinking indicator; a cursor (not an int position) marks where it starts,
+        # so the mark follows the text when the block cap prunes old messages
+        self._flush_chat()
+        self._thinking_cursor = QTextCursor(self.chat_display.document())
+        self._thinking_cursor.movePosition(QTextCursor.End)
+        self._thinking_cursor.setKeepPositionOnInsert(True)
+        self.chat_display.appendPlainText("\n💭 Claude is thinking...\n")
+        
+        # One exchange at a time: input and buttons stay disabled until the reply is done
+        self._set_busy(True)
+        self._stream_cursor = None
+        
+        # Stream the reply on the thread pool; chunks arrive via _on_stream_chunk
+        self._stream = _StreamRunnable(
+            self.menu_llm.respond_stream(
+                action_type="default",
+                user_input=user_message,
+                metamodel_context="Free-form chat about the NFR Framework. Answer questions naturally and helpfully."
+            ),
+            self._on_stream_chunk,
+            self._on_stream_done
+        )
+        QThreadPool.globalInstance().start(self._stream)
+    
+    def _set_busy(self, busy):
+        """Enable/disable the input and buttons while a reply is streaming"""
+        self.text_input.setEnabled(not busy)
+        self.send_btn.setEnabled(not busy)
+        self.clear_btn.setEnabled(not busy)
+    
+    @Slot(str)
+    def _on_stream_chunk(self, chunk):
+        """Show streamed text in place of the thinking indicator as tokens arrive"""
+        if self._stream_cursor is None:
+            self._remove_thinking_indicator()
+            self._stream_cursor = QTextCursor(self.chat_display.document())
+            self._stream_cursor.movePosition(QTextCursor.End)
+            self._stream_cursor.insertText("\n")
+        self._stream_cursor.insertText(chunk)
+    
+    @Slot(str)
+    def _on_stream_done(self, response):
+        """Replace the streamed text (or thinking indicator) with the formatted response"""
+        self._remove_thinking_indicator()
+        self._thinking_cursor = None
+        self._stream_cursor = None
+        self._stream = None
+        self.add_to_chat("Claude", response, "#4CAF50")
+        self._set_busy(False)
+        self.text_input.setFocus()
+    
+    def _remove_thinking_indicator(self):
+        """Delete the thinking indicator (and any streamed text) from the end of the chat display"""
+        if self._thinking_cursor is None:
+            return
+        self._thinking_cursor.clearSelection()
+        self._thinking_cursor.movePosition(QTextCursor.End, QTextCursor.KeepAnchor)
+        self._thinking_cursor.removeSelectedText()
     
     def add_to_chat(self, sender, message, color):
         """Add a message to the chat display"""
         self.chat_history.append((sender, message))
         
         # Format message with HTML for styling
-        formatted = f'<div style="margin-bottom: 15px;">'
-        formatted += f'<b style="color: {color}; font-size: 14pt;">{sender}:</b><br>'
-        formatted += f'<span style="color: #333; font-size: 13pt;">{message.replace(chr(10), "<br>")}</span>'
-        formatted += '</div>'
+        formatted = _CHAT_MSG_TEMPLATE.format(
+            color=color,
+            sender=sender.translate(_HTML_ESC),
+            message=message.translate(_HTML_ESC)
+        )
         
-        self.chat_display.append(formatted)
+        self._pending.append(formatted)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_chat(self):
+        """Append all pending messages to the display in one insert"""
+        self._flush_timer.stop()
+        if not self._pending:
+            return
         
-        # Scroll to bottom
+        # Only follow new messages if the user hasn't scrolled up
         scrollbar = self.chat_display.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 4
+        
+        self.chat_display.setUpdatesEnabled(False)
+        self.chat_display.appendHtml(''.join(self._pending))
+        self.chat_display.setUpdatesEnabled(True)
+        self._pending.clear()
+        
+        # No point pinning the scrollbar while the window is hidden/minimized
+        if at_bottom and self.chat_display.isVisible():
+            scrollbar.setValue(scrollbar.maximum())
+    
+    def reset_state(self):
+        """Start a reused chat window empty, unless a reply is still streaming"""
+        if getattr(self, '_stream', None) is not None:
+            return
+        super().reset_state()
+        self.chat_history.clear()
+        self._pending.clear()
+        self._flush_timer.stop()
+        self.chat_display.clear()
     
     def clear_chat(self):
         """Clear the chat history"""
-        self.chat_history = []
+        self.chat_history.clear()
+        self._pending.clear()
+        self._flush_timer.stop()
         self.chat_display.clear()
         self.chat_display.setPlaceholderText("Chat cleared. Ask me anything about the NFR Framework!")
\ No newline at end of file
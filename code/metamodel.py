@@ -1,24 +1,27 @@
 from typing import List, Dict, Any, Optional
-from enum import Enum
+from enum import Enum, IntEnum
 import inspect
 import sys
-import os
-parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, parent_dir)
 
 # ============================================================================
 # LEVEL 1: METAMODEL (Ontology) - METACLASSES
 # ============================================================================
 
+# Metaclass attributes per class (frozensets, shared rather than copied)
+_ATTR_CACHE: Dict[type, frozenset] = {}
+
+
+def _set_metaclass_attributes(cls, attrs):
+    _ATTR_CACHE[cls] = cls._metaclass_attributes = frozenset(attrs)
+
+
 class PropositionMetaClass(type):
     pass
     def __new__(mcs, name, bases, namespace):
         cls = super().__new__(mcs, name, bases, namespace)
-        # Always create new set (don't share with parent)
-        parent_attrs = set()
-        if hasattr(cls, '_metaclass_attributes'):
-            parent_attrs = cls._metaclass_attributes.copy()
-        cls._metaclass_attributes = parent_attrs | {'priority', 'label'}
+        # Union of the parents' attributes plus our own
+        parent_attrs = frozenset().union(*(_ATTR_CACHE.get(b, ()) for b in bases))
+        _set_metaclass_attributes(cls, parent_attrs | {'priority', 'label'})
         return cls
 
 
@@ -26,12 +29,8 @@ class SoftgoalMetaClass(PropositionMetaClass):
     pass
     def __new__(mcs, name, bases, namespace):
         cls = super().__new__(mcs, name, bases, namespace)
-
-        parent_attrs = set()
-        if hasattr(cls, '_metaclass_attributes'):
-            parent_attrs = cls._metaclass_attributes.copy()
-        # Create new set with parent + new attributes
-        cls._metaclass_attributes = parent_attrs | {'type', 'topic'}
+        # Proposition attributes (set by super) + new attributes
+        _set_metaclass_attributes(cls, _ATTR_CACHE[cls] | {'type', 'topic'})
         return cls
 
 
@@ -47,7 +46,7 @@ class ClaimSoftgoalMetaClass(SoftgoalMetaClass):
     def __new__(mcs, name, bases, namespace):
         cls = super().__new__(mcs, name, bases, namespace)
         # ClaimSoftgoal has ONLY argument attribute
-        cls._metaclass_attributes = {'argument'}
+        _set_metaclass_attributes(cls, {'argument'})
         return cls
 
 
@@ -75,6 +74,13 @@ class ClaimDecompositionMethodMetaClass(DecompositionMethodMetaClass):
     pass
 
 
+class MethodKind(IntEnum):
+    """Kind tag carried by every DecompositionMethod (cheap alternative to isinstance)"""
+    NFR = 1
+    OPERATIONALIZATION = 2
+    CLAIM = 3
+
+
 # ============================================================================
 # LEVEL 2: MODEL - CLASSES
 # ============================================================================
@@ -83,7 +89,7 @@ class ClaimDecompositionMethodMetaClass(DecompositionMethodMetaClass):
 # Enums and Base Types
 # ----------------------------------------------------------------------------
 
-class PropositionPriority(Enum):
+class PropositionPriority(IntEnum):
     pass
     CRITICAL = 1
     HIGH = 2
@@ -119,6 +125,8 @@ class ContributionType(Enum):
 
 class Proposition(metaclass=PropositionMetaClass):
     pass
+    __slots__ = ('priority', 'label')
+    
     def __init__(self):
         self.priority = PropositionPriority.MEDIUM
         self.label = PropositionLabel.UNKNOWN
@@ -126,22 +134,40 @@ class Proposition(metaclass=PropositionMetaClass):
 
 class Softgoal(Proposition, metaclass=SoftgoalMetaClass):
     pass
+    __slots__ = ('topic',)
+    type = None  # Class-level attribute; each *Softgoal class sets its *Type
+    
     def __init__(self):
-        super().__init__()
-        self.type = None
+        # Proposition.__init__ inlined (saves a call per softgoal)
+        self.priority = PropositionPriority.MEDIUM
+        self.label = PropositionLabel.UNKNOWN
         self.topic = None
 
 
 class NFRSoftgoal(Softgoal, metaclass=NFRSoftgoalMetaClass):
     pass
+    __slots__ = ()
 
 
 class OperationalizingSoftgoal(Softgoal, metaclass=OperationalizingSoftgoalMetaClass):
     pass
+    __slots__ = ()
 
 
 class ClaimSoftgoal(Softgoal, metaclass=ClaimSoftgoalMetaClass):
     pass
+    __slots__ = ('argument', 'supports')
+    
+    # Claims are value objects: one shared instance per (argument, supports)
+    _instances: Dict[tuple, 'ClaimSoftgoal'] = {}
+    
+    def __new__(cls, argument: str = "", supports=None):
+        key = (cls, argument, supports)
+        claim = cls._instances.get(key)
+        if claim is None:
+            claim = cls._instances[key] = super().__new__(cls)
+        return claim
+    
     def __init__(self, argument: str = "",  supports=None):
         # Don't call super().__init__() to avoid getting label, priority
         self.argument = argument
@@ -149,8 +175,19 @@ class ClaimSoftgoal(Softgoal, metaclass=ClaimSoftgoalMetaClass):
 
 class SoftgoalTopic:
     pass
+    __slots__ = ('name',)
+    
+    # One shared instance per topic name, so topics compare by identity
+    _instances: Dict[str, 'SoftgoalTopic'] = {}
+    
+    def __new__(cls, name: str):
+        topic = cls._instances.get(name)
+        if topic is None:
+            topic = cls._instances[sys.intern(name)] = super().__new__(cls)
+        return topic
+    
     def __init__(self, name: str):
-        self.name = name
+        self.name = sys.intern(name)
     
     def __repr__(self):
         return f"SoftgoalTopic('{self.name}')"
@@ -662,483 +699,141 @@ class RapidTaskMasteryType(OperationalizingSoftgoalType):
 # Softgoal Classes (for creating instances)
 # ----------------------------------------------------------------------------
 
-class PerformanceSoftgoal(NFRSoftgoal):
-    pass
-    type = PerformanceType  # Class-level attribute
-
-
-class TimePerformanceSoftgoal(NFRSoftgoal):
-    pass
-    type = TimePerformanceType
-
-
-class SpacePerformanceSoftgoal(NFRSoftgoal):
-    pass
-    type = SpacePerformanceType
-
-
-class ResponsivenessPerformanceSoftgoal(NFRSoftgoal):
-    pass
-    type = ResponsivenessPerformanceType
-
-
-# Windows Task Manager Performance Softgoal Classes
-class CPUUtilizationSoftgoal(NFRSoftgoal):
-    pass
-    type = CPUUtilizationType
-
-
-class MemoryUsageSoftgoal(NFRSoftgoal):
-    pass
-    type = MemoryUsageType
-
-
-class DiskTimeSoftgoal(NFRSoftgoal):
-    pass
-    type = DiskTimeType
-
-
-class NetworkThroughputSoftgoal(NFRSoftgoal):
-    pass
-    type = NetworkThroughputType
-
-
-class GPUUtilizationSoftgoal(NFRSoftgoal):
-    pass
-    type = GPUUtilizationType
-
-
-class SecuritySoftgoal(NFRSoftgoal):
-    pass
-    type = SecurityType
-
-
-class ConfidentialitySoftgoal(NFRSoftgoal):
-    pass
-    type = ConfidentialityType
-
-
-class IntegritySoftgoal(NFRSoftgoal):
-    pass
-    type = IntegrityType
-
-
-class AvailabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = AvailabilityType
-
-
-class UsabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = UsabilityType
-
-
-class ReliabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = ReliabilityType
-
-
-class MaintainabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = MaintainabilityType
-
-
-# Additional NFR Softgoal Classes (alphabetically ordered)
-class AccuracySoftgoal(NFRSoftgoal):
-    pass
-    type = AccuracyType
-
-
-class AdaptabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = AdaptabilityType
-
-
-class BiasSoftgoal(NFRSoftgoal):
-    pass
-    type = BiasType
-
-
-class CompletenessSoftgoal(NFRSoftgoal):
-    pass
-    type = CompletenessType
-
-
-class ComplexitySoftgoal(NFRSoftgoal):
-    pass
-    type = ComplexityType
-
-
-class ConsistencySoftgoal(NFRSoftgoal):
-    pass
-    type = ConsistencyType
-
-
-class CorrectnessSoftgoal(NFRSoftgoal):
-    pass
-    type = CorrectnessType
-
-
-class DomainAdaptationSoftgoal(NFRSoftgoal):
-    pass
-    type = DomainAdaptationType
-
-
-class EfficiencySoftgoal(NFRSoftgoal):
-    pass
-    type = EfficiencyType
-
-
-class EthicsSoftgoal(NFRSoftgoal):
-    pass
-    type = EthicsType
-
-
-class ExplainabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = ExplainabilityType
-
-
-class FairnessSoftgoal(NFRSoftgoal):
-    pass
-    type = FairnessType
-
-
-class FaultToleranceSoftgoal(NFRSoftgoal):
-    pass
-    type = FaultToleranceType
-
-
-class FlexibilitySoftgoal(NFRSoftgoal):
-    pass
-    type = FlexibilityType
-
-
-class InterpretabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = InterpretabilityType
-
-
-class InteroperabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = InteroperabilityType
-
-
-class JustifiabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = JustifiabilityType
-
-
-class PortabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = PortabilityType
-
-
-class PrivacySoftgoal(NFRSoftgoal):
-    pass
-    type = PrivacyType
-
-
-class RepeatabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = RepeatabilityType
-
-
-class RetrainabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = RetrainabilityType
-
-
-class ReproducibilitySoftgoal(NFRSoftgoal):
-    pass
-    type = ReproducibilityType
-
-
-class ReusabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = ReusabilityType
-
-
-class SafetySoftgoal(NFRSoftgoal):
-    pass
-    type = SafetyType
-
-
-class ScalabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = ScalabilityType
-
-
-class TestabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = TestabilityType
-
-
-class TransparencySoftgoal(NFRSoftgoal):
-    pass
-    type = TransparencyType
-
-
-class TraceabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = TraceabilityType
-
-
-class TrustSoftgoal(NFRSoftgoal):
-    pass
-    type = TrustType
-
-
-class LegalComplianceSoftgoal(NFRSoftgoal):
-    pass
-    type = LegalComplianceType
-
-
-class LookFeelSoftgoal(NFRSoftgoal):
-    pass
-    type = LookFeelType
-
-class RecoverabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = RecoverabilityType
-
-class DiagnosabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = DiagnosabilityType
-
-class CompatibilitySoftgoal(NFRSoftgoal):
-    pass
-    type = CompatibilityType
-
-class DeterministicBehaviorSoftgoal(NFRSoftgoal):
-    pass
-    type = DeterministicBehaviorType    
-
-class LearnabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = LearnabilityType
-
-class MemorabilitySoftgoal(NFRSoftgoal):
-    pass
-    type = MemorabilityType
-
-class ErrorPreventionSoftgoal(NFRSoftgoal):
-    pass
-    type = ErrorPreventionType
-
-class SatisfactionSoftgoal(NFRSoftgoal):
-    pass
-    type = SatisfactionType
-
-class SimpleNaturalDialogueSoftgoal(NFRSoftgoal):
-    pass
-    type = SimpleNaturalDialogueType
-
-
-class UserLanguageSoftgoal(NFRSoftgoal):
-    pass
-    type = UserLanguageType
-
-
-class MinimizeMemoryLoadSoftgoal(NFRSoftgoal):
-    pass
-    type = MinimizeMemoryLoadType
-
-
-# ConsistencySoftgoal already exists
-
-
-class FeedbackSoftgoal(NFRSoftgoal):
-    pass
-    type = FeedbackType
-
-
-class ClearlyMarkedExitsSoftgoal(NFRSoftgoal):
-    pass
-    type = ClearlyMarkedExitsType
-
-
-class ShortcutsSoftgoal(NFRSoftgoal):
-    pass
-    type = ShortcutsType
-
-
-class GoodErrorMessagesSoftgoal(NFRSoftgoal):
-    pass
-    type = GoodErrorMessagesType
-
-
-# ErrorPreventionSoftgoal already exists
-
-
-class HelpDocumentationSoftgoal(NFRSoftgoal):
-    pass
-    type = HelpDocumentationType
-
-
-
-# Operationalizing Technique Softgoal Classes   
-
-class IndexingSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = IndexingType
-
-
-class CachingSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = CachingType
-
-
-class EncryptionSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = EncryptionType
-
-class SymmetricKeyEncryptionSoftgoal(EncryptionSoftgoal):
-    pass
-    type = SymmetricKeyEncryptionType
-
-class PublicKeyEncryptionSoftgoal(EncryptionSoftgoal):
-    pass
-    type = PublicKeyEncryptionType
-
-class RSAEncryptionSoftgoal(PublicKeyEncryptionSoftgoal):
-    pass
-    type = RSAEncryptionType
-
-
-
-class AuditingSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = AuditingType
-
-class ExceptionHandlingSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = ExceptionHandlingType
-
-class SearchSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = SearchType
-
-class DisplaySoftgoal(OperationalizingSoftgoal):
-    pass
-    type = DisplayType
-
-
-class RefreshSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = RefreshType
-
-
-class LogSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = LogType
-
-
-class AuthenticationSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = AuthenticationType
-
-class AuthorizationSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = AuthorizationType
-
-class AccessRuleValidationSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = AccessRuleValidationType
-
-class IdentificationSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = IdentificationType
-
-class SyncSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = SyncType
-
-
-class MonitorSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = MonitorType
-
-
-class ValidationSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = ValidationType
-
-
-class NotifySoftgoal(OperationalizingSoftgoal):
-    pass
-    type = NotifyType
-
-
-class StoreSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = StoreType
-
-
-class ExportSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = ExportType
-
-
-class BackupSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = BackupType
-
-class CompressionSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = CompressionType
-
-class LoadBalancingSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = LoadBalancingType
-
-class VirtualizationSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = VirtualizationType
-
-class NetworkMonitoringSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = NetworkMonitoringType
-
-class DataWarehouseSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = DataWarehouseType
-
-class SimulationSoftgoal(OperationalizingSoftgoal): 
-    pass
-    type = SimulationType
-
-class EarlyWarningSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = EarlyWarningType
-
-class MultimodalFeedbackSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = MultimodalFeedbackType
+# Every softgoal class only differs in its name, base and matching *Type, so
+# they are built from this table: ("Performance", "NFRSoftgoal") defines
+# class PerformanceSoftgoal(NFRSoftgoal) with type = PerformanceType
+_SOFTGOAL_CLASSES = (
+    ("Performance", "NFRSoftgoal"),
+    ("TimePerformance", "NFRSoftgoal"),
+    ("SpacePerformance", "NFRSoftgoal"),
+    ("ResponsivenessPerformance", "NFRSoftgoal"),
+
+    # Windows Task Manager Performance Softgoal Classes
+    ("CPUUtilization", "NFRSoftgoal"),
+    ("MemoryUsage", "NFRSoftgoal"),
+    ("DiskTime", "NFRSoftgoal"),
+    ("NetworkThroughput", "NFRSoftgoal"),
+    ("GPUUtilization", "NFRSoftgoal"),
+
+    ("Security", "NFRSoftgoal"),
+    ("Confidentiality", "NFRSoftgoal"),
+    ("Integrity", "NFRSoftgoal"),
+    ("Availability", "NFRSoftgoal"),
+    ("Usability", "NFRSoftgoal"),
+    ("Reliability", "NFRSoftgoal"),
+    ("Maintainability", "NFRSoftgoal"),
+
+    # Additional NFR Softgoal Classes (alphabetically ordered)
+    ("Accuracy", "NFRSoftgoal"),
+    ("Adaptability", "NFRSoftgoal"),
+    ("Bias", "NFRSoftgoal"),
+    ("Completeness", "NFRSoftgoal"),
+    ("Complexity", "NFRSoftgoal"),
+    ("Consistency", "NFRSoftgoal"),
+    ("Correctness", "NFRSoftgoal"),
+    ("DomainAdaptation", "NFRSoftgoal"),
+    ("Efficiency", "NFRSoftgoal"),
+    ("Ethics", "NFRSoftgoal"),
+    ("Explainability", "NFRSoftgoal"),
+    ("Fairness", "NFRSoftgoal"),
+    ("FaultTolerance", "NFRSoftgoal"),
+    ("Flexibility", "NFRSoftgoal"),
+    ("Interpretability", "NFRSoftgoal"),
+    ("Interoperability", "NFRSoftgoal"),
+    ("Justifiability", "NFRSoftgoal"),
+    ("Portability", "NFRSoftgoal"),
+    ("Privacy", "NFRSoftgoal"),
+    ("Repeatability", "NFRSoftgoal"),
+    ("Retrainability", "NFRSoftgoal"),
+    ("Reproducibility", "NFRSoftgoal"),
+    ("Reusability", "NFRSoftgoal"),
+    ("Safety", "NFRSoftgoal"),
+    ("Scalability", "NFRSoftgoal"),
+    ("Testability", "NFRSoftgoal"),
+    ("Transparency", "NFRSoftgoal"),
+    ("Traceability", "NFRSoftgoal"),
+    ("Trust", "NFRSoftgoal"),
+    ("LegalCompliance", "NFRSoftgoal"),
+    ("LookFeel", "NFRSoftgoal"),
+    ("Recoverability", "NFRSoftgoal"),
+    ("Diagnosability", "NFRSoftgoal"),
+    ("Compatibility", "NFRSoftgoal"),
+    ("DeterministicBehavior", "NFRSoftgoal"),
+    ("Learnability", "NFRSoftgoal"),
+    ("Memorability", "NFRSoftgoal"),
+    ("ErrorPrevention", "NFRSoftgoal"),
+    ("Satisfaction", "NFRSoftgoal"),
+    ("SimpleNaturalDialogue", "NFRSoftgoal"),
+    ("UserLanguage", "NFRSoftgoal"),
+    ("MinimizeMemoryLoad", "NFRSoftgoal"),
+    ("Feedback", "NFRSoftgoal"),
+    ("ClearlyMarkedExits", "NFRSoftgoal"),
+    ("Shortcuts", "NFRSoftgoal"),
+    ("GoodErrorMessages", "NFRSoftgoal"),
+    ("HelpDocumentation", "NFRSoftgoal"),
+
+    # Operationalizing Technique Softgoal Classes
+    ("Indexing", "OperationalizingSoftgoal"),
+    ("Caching", "OperationalizingSoftgoal"),
+    ("Encryption", "OperationalizingSoftgoal"),
+    ("SymmetricKeyEncryption", "EncryptionSoftgoal"),
+    ("PublicKeyEncryption", "EncryptionSoftgoal"),
+    ("RSAEncryption", "PublicKeyEncryptionSoftgoal"),
+    ("Auditing", "OperationalizingSoftgoal"),
+    ("ExceptionHandling", "OperationalizingSoftgoal"),
+    ("Search", "OperationalizingSoftgoal"),
+    ("Display", "OperationalizingSoftgoal"),
+    ("Refresh", "OperationalizingSoftgoal"),
+    ("Log", "OperationalizingSoftgoal"),
+    ("Authentication", "OperationalizingSoftgoal"),
+    ("Authorization", "OperationalizingSoftgoal"),
+    ("AccessRuleValidation", "OperationalizingSoftgoal"),
+    ("Identification", "OperationalizingSoftgoal"),
+    ("Sync", "OperationalizingSoftgoal"),
+    ("Monitor", "OperationalizingSoftgoal"),
+    ("Validation", "OperationalizingSoftgoal"),
+    ("Notify", "OperationalizingSoftgoal"),
+    ("Store", "OperationalizingSoftgoal"),
+    ("Export", "OperationalizingSoftgoal"),
+    ("Backup", "OperationalizingSoftgoal"),
+    ("Compression", "OperationalizingSoftgoal"),
+    ("LoadBalancing", "OperationalizingSoftgoal"),
+    ("Virtualization", "OperationalizingSoftgoal"),
+    ("NetworkMonitoring", "OperationalizingSoftgoal"),
+    ("DataWarehouse", "OperationalizingSoftgoal"),
+    ("Simulation", "OperationalizingSoftgoal"),
+    ("EarlyWarning", "OperationalizingSoftgoal"),
+    ("MultimodalFeedback", "OperationalizingSoftgoal"),
+    ("PersonalizedInterfaces", "OperationalizingSoftgoal"),
+    ("ConciseAudioInstructions", "OperationalizingSoftgoal"),
+    ("NonSpeechAudioCues", "OperationalizingSoftgoal"),
+    ("SubMeterPositioning", "OperationalizingSoftgoal"),
+    ("SensorFusion", "OperationalizingSoftgoal"),
+    ("RapidTaskMastery", "OperationalizingSoftgoal"),
+)
 
-class PersonalizedInterfacesSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = PersonalizedInterfacesType
+# *Type -> *Softgoal class (filled by the loop below; read via softgoal_class_for)
+_SOFTGOAL_FOR_TYPE: Dict[type, type] = {}
 
-class ConciseAudioInstructionsSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = ConciseAudioInstructionsType
 
-class NonSpeechAudioCuesSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = NonSpeechAudioCuesType
+def softgoal_class_for(type_cls):
+    """The *Softgoal class whose type is type_cls, or None"""
+    return _SOFTGOAL_FOR_TYPE.get(type_cls)
 
-class SubMeterPositioningSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = SubMeterPositioningType
+# These add no metaclass attributes of their own, so the metaclass __new__
+# chain is skipped: create the class directly and share the base's attributes
+for _name, _base in _SOFTGOAL_CLASSES:
+    _base = globals()[_base]
+    _cls = type.__new__(type(_base), f"{_name}Softgoal", (_base,), {
+        "__module__": __name__,
+        "__qualname__": f"{_name}Softgoal",
+        "__slots__": (),
+        "type": globals()[f"{_name}Type"],
+    })
+    _set_metaclass_attributes(_cls, _ATTR_CACHE[_base])
+    globals()[_cls.__name__] = _SOFTGOAL_FOR_TYPE[_cls.type] = _cls
+del _name, _base, _cls
 
-class SensorFusionSoftgoal(OperationalizingSoftgoal):
-    pass
-    type = SensorFusionType
-
-class RapidTaskMasterySoftgoal(OperationalizingSoftgoal):
-    pass
-    type = RapidTaskMasteryType
 
 # ----------------------------------------------------------------------------
 # Method Classes
@@ -1151,6 +846,7 @@ class Method(metaclass=MethodMetaClass):
 
 class DecompositionMethod(Method, metaclass=DecompositionMethodMetaClass):
     pass
+    kind: Optional[MethodKind] = None
     def __init__(self, name: str, parent, offspring: List):
         self.name = name
         self.parent = parent  # Parent type being decomposed
@@ -1163,6 +859,7 @@ class DecompositionMethod(Method, metaclass=DecompositionMethodMetaClass):
 
 class NFRDecompositionMethod(DecompositionMethod, metaclass=NFRDecompositionMethodMetaClass):
     pass
+    kind = MethodKind.NFR
 
 class PerformanceDecompositionMethod(NFRDecompositionMethod):
     pass
@@ -1179,6 +876,7 @@ class UsabilityDecompositionMethod(NFRDecompositionMethod):
 
 class OperationalizationDecompositionMethod(DecompositionMethod, metaclass=OperationalizationDecompositionMethodMetaClass):
     pass
+    kind = MethodKind.OPERATIONALIZATION
 
 class AuthorizationDecompositionMethod(OperationalizationDecompositionMethod):
     pass
@@ -1186,10 +884,13 @@ class AuthorizationDecompositionMethod(OperationalizationDecompositionMethod):
 
 class ClaimDecompositionMethod(DecompositionMethod, metaclass=ClaimDecompositionMethodMetaClass):
     pass
+    kind = MethodKind.CLAIM
 
 
 class Contribution(Proposition, metaclass=ContributionMetaClass):
     pass
+    __slots__ = ('source', 'target', 'type')
+    
     def __init__(self, source_name: str, target_name: str, contribution_type: ContributionType):
         super().__init__()
         self.source = source_name
@@ -9,8 +9,9 @@ Provides functions to query the 3-level metamodel:
 """
 
 import inspect
+import functools
 from utils import format_entity_name
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Iterator
 import metamodel
 
 
@@ -50,10 +51,44 @@ def get_metaclass_attributes(cls) -> List[str]:
     return []
 
 
+_FORMATTED_NAME_CACHE: Dict[str, str] = {}
+
+
+def _formatted(name: str) -> str:
+    """
+    Display name for a metamodel class name (see format_entity_name).
+    The table for all metamodel classes is built on first use.
+    """
+    if not _FORMATTED_NAME_CACHE:
+        for cls_name, obj in inspect.getmembers(metamodel, inspect.isclass):
+            _FORMATTED_NAME_CACHE[cls_name] = format_entity_name(cls_name)
+    return _FORMATTED_NAME_CACHE.get(name) or format_entity_name(name)
+
+
 # ============================================================================
 # ENTITY RESOLUTION
 # ============================================================================
 
+# Public metamodel names that are bookkeeping, not framework entities
+_NON_ENTITIES = frozenset(("MethodKind",))
+
+
+def _entity_members():
+    """
+    (name, obj) pairs of the metamodel's entities, in name order: classes,
+    metaclasses and instances defined in metamodel.py. Private names, helper
+    functions, imported names (Enum, List, ...) and _NON_ENTITIES are skipped.
+    """
+    for member_name, obj in inspect.getmembers(metamodel):
+        if member_name.startswith('_') or member_name in _NON_ENTITIES:
+            continue
+        if inspect.isfunction(obj) or inspect.ismodule(obj):
+            continue
+        if getattr(obj, '__module__', None) != metamodel.__name__:
+            continue
+        yield member_name, obj
+
+
 def getEntity(name: str):
     """
     Get entity by name from any level with intelligent fuzzy matching.
@@ -114,10 +149,9 @@ def getEntity(name: str):
         name_lower = term_map[name_lower].lower()
     
     # Try exact match first
-    for member_name, obj in inspect.getmembers(metamodel):
+    for member_name, obj in _entity_members():
         if member_name.lower() == name_lower:
-            if not inspect.isfunction(obj) and not inspect.ismodule(obj):
-                return obj
+            return obj
     
     # If no exact match, try fuzzy matching with Type/Softgoal suffixes
     # This handles queries like "Performance" ÃƒÂ¢Ã¢â‚¬Â Ã¢â‚¬â„¢ "PerformanceType"
@@ -128,21 +162,19 @@ def getEntity(name: str):
     ]
     
     for variant in fuzzy_variants:
-        for member_name, obj in inspect.getmembers(metamodel):
+        for member_name, obj in _entity_members():
             if member_name.lower() == variant:
-                if not inspect.isfunction(obj) and not inspect.ismodule(obj):
-                    return obj
+                return obj
     
     # Still not found? Try partial/prefix matching
     # This handles queries like "Softgoa" ÃƒÂ¢Ã¢â‚¬Â Ã¢â‚¬â„¢ "Softgoal", "Performanc" ÃƒÂ¢Ã¢â‚¬Â Ã¢â‚¬â„¢ "PerformanceType"
     # Find all entities that start with the search term (minimum 3 characters)
     if len(name_lower) >= 3:
         matches = []
-        for member_name, obj in inspect.getmembers(metamodel):
-            if not inspect.isfunction(obj) and not inspect.ismodule(obj):
-                # Check if member starts with the search term
-                if member_name.lower().startswith(name_lower):
-                    matches.append((member_name, obj))
+        for member_name, obj in _entity_members():
+            # Check if member starts with the search term
+            if member_name.lower().startswith(name_lower):
+                matches.append((member_name, obj))
         
         # If we found exactly one match, return it
         if len(matches) == 1:
@@ -311,6 +343,20 @@ def getMetaclass(cls):
     return None
 
 
+def getSoftgoalClass(type_cls):
+    """
+    Get the Softgoal class whose instances have type_cls as their type.
+    
+    Examples:
+        >>> getSoftgoalClass(TimePerformanceType)
+        <class 'TimePerformanceSoftgoal'>
+        
+        >>> getSoftgoalClass(NFRSoftgoalType)
+        None
+    """
+    return metamodel.softgoal_class_for(type_cls)
+
+
 def isNFR(entity) -> bool:
     """
     Check if an entity is a non-functional requirement or NFR-related type.
@@ -360,6 +406,22 @@ def isNFR(entity) -> bool:
 # CONTRIBUTION QUERIES
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
+def _contrib_index() -> Dict[str, List]:
+    """
+    Index all Contribution instances by lowercased source name.
+    Reads the module dict directly (no getattr as with getmembers), sorted
+    by variable name so the order matches getmembers.
+    Built once on first use; call _contrib_index.cache_clear() if the
+    metamodel is reloaded.
+    """
+    index = {}
+    for name, obj in sorted(vars(metamodel).items()):
+        if isinstance(obj, metamodel.Contribution):
+            index.setdefault(obj.source.lower(), []).append(obj)
+    return index
+
+
 def getContributions(source_name: str) -> List[Dict]:
     """
     Get all contributions from a source.
@@ -371,36 +433,44 @@ def getContributions(source_name: str) -> List[Dict]:
     """
     contributions = []
     
-    # Find all Contribution instances in metamodel
-    for name, obj in inspect.getmembers(metamodel):
-        if isinstance(obj, metamodel.Contribution):
-            if obj.source.lower() == source_name.lower():
-                contributions.append({
-                    'target': obj.target,
-                    'type': obj.type.value
-                })
+    # Look up Contribution instances by source
+    for obj in _contrib_index().get(source_name.lower(), []):
+        contributions.append({
+            'target': obj.target,
+            'type': obj.type.value
+        })
     
     return contributions
 
 
 def checkContribution(source: str, target: str) -> Dict:
     """
-    Check if source contributes to target.
+    Check if source contributes to target, directly or through one
+    intermediate softgoal (source -> X -> target, see composeContributions).
     
     Returns:
-        {'contributes': bool, 'type': str or None}
+        {'contributes': bool, 'type': str or None, 'via': str or None}
     """
-    # Find all Contribution instances
-    for name, obj in inspect.getmembers(metamodel):
-        if isinstance(obj, metamodel.Contribution):
-            if (obj.source.lower() == source.lower() and 
-                obj.target.lower() == target.lower()):
-                return {
-                    'contributes': True,
-                    'type': obj.type.value
-                }
+    index = _contrib_index()
+    target_lower = target.lower()
+    links = index.get(source.lower(), [])
+    
+    for obj in links:
+        if obj.target.lower() == target_lower:
+            return {'contributes': True, 'type': obj.type.value, 'via': None}
+    
+    # No direct link: compose the first two-link chain with a known effect
+    for first in links:
+        if first.type not in _CONTRIB_ORD:
+            continue  # CLAIM links don't compose
+        for second in index.get(first.target.lower(), []):
+            if second.target.lower() != target_lower or second.type not in _CONTRIB_ORD:
+                continue
+            net = composeContributions(first.type, second.type)
+            if net is not _CT.UNKNOWN:
+                return {'contributes': True, 'type': net.value, 'via': first.target}
     
-    return {'contributes': False, 'type': None}
+    return {'contributes': False, 'type': None, 'via': None}
 
 
 def checkContributionToAnyNFR(source: str) -> Dict:
@@ -435,6 +505,61 @@ def checkContributionToAnyNFR(source: str) -> Dict:
     }
 
 
+# Contribution types from strongest positive to strongest negative
+# (CLAIM links argue for a target and don't compose)
+_CT = metamodel.ContributionType
+_CONTRIB_LIST = (_CT.MAKE, _CT.HELP, _CT.SOME_PLUS, _CT.UNKNOWN,
+                 _CT.SOME_MINUS, _CT.HURT, _CT.BREAK)
+_CONTRIB_ORD = {t: i for i, t in enumerate(_CONTRIB_LIST)}
+
+
+def _compose_ord(a: int, b: int) -> int:
+    """Compose two contribution indices (rules in composeContributions)"""
+    sign_a = (3 > a) - (a > 3)
+    sign_b = (3 > b) - (b > 3)
+    if not sign_a or not sign_b or (sign_a < 0 and sign_b < 0):
+        return 3  # UNKNOWN
+    strength = min(abs(a - 3), abs(b - 3))  # 3 = MAKE/BREAK, 2 = HELP/HURT, 1 = SOME
+    return 3 - sign_a * sign_b * strength
+
+
+# Full 7x7 composition table, indexed by a * 7 + b
+_COMPOSE = bytes(_compose_ord(a, b) for a in range(7) for b in range(7))
+
+
+def composeContributions(first, second):
+    """
+    Net contribution type of a chain (A --first--> B --second--> C).
+    
+    Follows label propagation in the NFR Framework's evaluation procedure
+    (Chung, Nixon, Yu & Mylopoulos, "Non-Functional Requirements in Software
+    Engineering", 2000, ch. 3), reading each link as what a satisficed
+    source does to its target:
+    - positive first link: B is (weakly) satisficed, so the second link
+      carries through, capped at the weaker of the two strengths
+    - negative first link: B is (weakly) denied; a positive second link then
+      denies C at the weaker strength, but a negative one leaves C
+      undetermined - denying B is no evidence for C, so two negatives
+      give UNKNOWN, never a positive
+    - UNKNOWN on either link gives UNKNOWN
+    
+    Examples:
+        >>> composeContributions(ContributionType.MAKE, ContributionType.HURT)
+        <ContributionType.HURT: 'HURT'>
+        >>> composeContributions(ContributionType.HURT, ContributionType.MAKE)
+        <ContributionType.HURT: 'HURT'>
+        >>> composeContributions(ContributionType.HURT, ContributionType.BREAK)
+        <ContributionType.UNKNOWN: 'UNKNOWN'>
+    
+    Raises:
+        ValueError: if either type is not composable (e.g. CLAIM)
+    """
+    for t in (first, second):
+        if t not in _CONTRIB_ORD:
+            raise ValueError(f"Cannot compose contribution type {t!r}")
+    return _CONTRIB_LIST[_COMPOSE[_CONTRIB_ORD[first] * 7 + _CONTRIB_ORD[second]]]
+
+
 # ============================================================================
 # INSTANCE QUERIES
 # ============================================================================
@@ -505,10 +630,14 @@ def getDecompositionsFor(softgoal_type) -> List:
     """
     decompositions = []
     
+    decomposition_method = getattr(metamodel, 'DecompositionMethod', None)
+    if decomposition_method is None:
+        return decompositions
+    
     # Search through metamodel for DecompositionMethod instances
     for name, obj in inspect.getmembers(metamodel):
         # Check if it's a DecompositionMethod instance
-        if hasattr(metamodel, 'DecompositionMethod') and isinstance(obj, metamodel.DecompositionMethod):
+        if isinstance(obj, decomposition_method):
             # Check if this method decomposes our type
             if hasattr(obj, 'parent') and obj.parent == softgoal_type:
                 decompositions.append(obj)
@@ -516,6 +645,23 @@ def getDecompositionsFor(softgoal_type) -> List:
     return decompositions
 
 
+@functools.lru_cache(maxsize=None)
+def _decomps_for(name: str) -> tuple:
+    """
+    Resolve an entity and split its decompositions by method kind (cached).
+    
+    Returns:
+        (entity, claim_decomps, nfr_decomps) where the decomposition
+        collections are tuples of ClaimDecompositionMethod and
+        NFRDecompositionMethod instances respectively
+    """
+    entity = getEntity(name)
+    decomps = getDecompositionsFor(entity)
+    claim = tuple(d for d in decomps if d.kind == metamodel.MethodKind.CLAIM)
+    nfr = tuple(d for d in decomps if d.kind == metamodel.MethodKind.NFR)
+    return entity, claim, nfr
+
+
 def whatIs(entity_or_name, verbose: bool = True) -> str:
     """
     Get comprehensive information about an entity.
@@ -729,26 +875,43 @@ def getAllNFRTypes() -> List[str]:
         >>> getAllNFRTypes()
         ['Performance', 'Security', 'Usability', 'Reliability', ...]
     """
-    nfr_types = []
-    
-    # Get NFRSoftgoalType class
-    if not hasattr(metamodel, 'NFRSoftgoalType'):
-        return []
-    
-    base_class = metamodel.NFRSoftgoalType
+    return list(_type_names('NFRSoftgoalType'))
+
+
+@functools.lru_cache(maxsize=None)
+def _type_names(base_name: str) -> tuple:
+    """
+    Sorted names (without 'Type' suffix) of all subclasses of the named
+    metamodel base type. Scanned once per base; call _type_names.cache_clear()
+    if the metamodel is reloaded.
+    """
+    base_class = getattr(metamodel, base_name, None)
+    if base_class is None:
+        return ()
     
+    names = []
     for name, obj in inspect.getmembers(metamodel):
         if inspect.isclass(obj) and obj != base_class:
-            # Check if it's a subclass of NFRSoftgoalType
             try:
                 if issubclass(obj, base_class):
                     # Remove 'Type' suffix for readability
-                    clean_name = name[:-4] if name.endswith('Type') else name
-                    nfr_types.append(clean_name)
+                    names.append(name[:-4] if name.endswith('Type') else name)
             except TypeError:
                 continue
-    
-    return sorted(nfr_types)
+    return tuple(sorted(names))
+
+
+def getAllNFRTypesIter() -> Iterator[str]:
+    """
+    Iterate NFR type names (without 'Type' suffix) in sorted order, from
+    the cached list. Use with itertools.islice when only a preview is needed.
+    """
+    return iter(_type_names('NFRSoftgoalType'))
+
+
+def _nfr_count() -> int:
+    """Number of NFR types in the metamodel"""
+    return len(_type_names('NFRSoftgoalType'))
 
 
 def getAllOperationalizingTypes() -> List[str]:
@@ -764,26 +927,20 @@ def getAllOperationalizingTypes() -> List[str]:
         >>> getAllOperationalizingTypes()
         ['Authentication', 'Backup', 'Caching', 'Display', 'Encryption', ...]
     """
-    op_types = []
-    
-    # Get OperationalizingSoftgoalType class
-    if not hasattr(metamodel, 'OperationalizingSoftgoalType'):
-        return []
-    
-    base_class = metamodel.OperationalizingSoftgoalType
-    
-    for name, obj in inspect.getmembers(metamodel):
-        if inspect.isclass(obj) and obj != base_class:
-            # Check if it's a subclass of OperationalizingSoftgoalType
-            try:
-                if issubclass(obj, base_class):
-                    # Remove 'Type' suffix for readability
-                    clean_name = name[:-4] if name.endswith('Type') else name
-                    op_types.append(clean_name)
-            except TypeError:
-                continue
-    
-    return sorted(op_types)
+    return list(_type_names('OperationalizingSoftgoalType'))
+
+
+def getAllOperationalizingTypesIter() -> Iterator[str]:
+    """
+    Iterate operationalizing type names (without 'Type' suffix) in sorted
+    order, from the cached list. Use with itertools.islice for a preview.
+    """
+    return iter(_type_names('OperationalizingSoftgoalType'))
+
+
+def _op_count() -> int:
+    """Number of operationalizing types in the metamodel"""
+    return len(_type_names('OperationalizingSoftgoalType'))
 
 
 def getAllSoftgoalTypes() -> Dict[str, List[str]]:
@@ -0,0 +1,55 @@
+import pytest
+
+import metamodel
+import nfr_queries
+from nfr_queries import composeContributions
+
+CT = metamodel.ContributionType
+ORDER = (CT.MAKE, CT.HELP, CT.SOME_PLUS, CT.UNKNOWN, CT.SOME_MINUS, CT.HURT, CT.BREAK)
+
+# Rows = first link, columns = second link, both in ORDER
+EXPECTED = [
+    ["MAKE",  "HELP",  "SOME+", "UNKNOWN", "SOME-",   "HURT",    "BREAK"],
+    ["HELP",  "HELP",  "SOME+", "UNKNOWN", "SOME-",   "HURT",    "HURT"],
+    ["SOME+", "SOME+", "SOME+", "UNKNOWN", "SOME-",   "SOME-",   "SOME-"],
+    ["UNKNOWN"] * 7,
+    ["SOME-", "SOME-", "SOME-", "UNKNOWN", "UNKNOWN", "UNKNOWN", "UNKNOWN"],
+    ["HURT",  "HURT",  "SOME-", "UNKNOWN", "UNKNOWN", "UNKNOWN", "UNKNOWN"],
+    ["BREAK", "HURT",  "SOME-", "UNKNOWN", "UNKNOWN", "UNKNOWN", "UNKNOWN"],
+]
+
+
+@pytest.mark.parametrize("i,first", list(enumerate(ORDER)))
+def test_compose_table_row(i, first):
+    assert [composeContributions(first, second).value for second in ORDER] == EXPECTED[i]
+
+
+def test_two_negatives_never_compose_to_a_positive():
+    negatives = (CT.SOME_MINUS, CT.HURT, CT.BREAK)
+    for first in negatives:
+        for second in negatives:
+            assert composeContributions(first, second) is CT.UNKNOWN
+
+
+def test_claim_does_not_compose():
+    with pytest.raises(ValueError):
+        composeContributions(CT.CLAIM, CT.HELP)
+    with pytest.raises(ValueError):
+        composeContributions(CT.HELP, CT.CLAIM)
+
+
+def test_check_contribution_direct():
+    assert nfr_queries.checkContribution("Indexing", "TimePerformance") == {
+        'contributes': True, 'type': 'HELP', 'via': None}
+
+
+def test_check_contribution_through_one_softgoal(monkeypatch):
+    monkeypatch.setattr(metamodel, "TestAToB", metamodel.Contribution("TestA", "TestB", CT.MAKE), raising=False)
+    monkeypatch.setattr(metamodel, "TestBToC", metamodel.Contribution("TestB", "TestC", CT.HURT), raising=False)
+    nfr_queries._contrib_index.cache_clear()
+    try:
+        assert nfr_queries.checkContribution("TestA", "TestC") == {
+            'contributes': True, 'type': 'HURT', 'via': 'TestB'}
+    finally:
+        monkeypatch.undo()
+        nfr_queries._contrib_index.cache_clear()
@@ -0,0 +1,11 @@
+import metamodel
+
+
+def test_generated_softgoal_classes_have_no_instance_dict():
+    assert not hasattr(metamodel.PerformanceSoftgoal(), "__dict__")
+    assert not hasattr(metamodel.SecuritySoftgoal(), "__dict__")
+
+
+def test_generated_softgoal_classes_keep_their_type():
+    assert metamodel.PerformanceSoftgoal.type is metamodel.PerformanceType
+    assert metamodel.PerformanceSoftgoal().type is metamodel.PerformanceType
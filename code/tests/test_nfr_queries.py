@@ -0,0 +1,18 @@
+import metamodel
+import nfr_queries
+
+
+def test_get_entity_skips_non_entity_names():
+    for name in ("MethodKind", "IntEnum", "Enum", "List", "Optional"):
+        assert nfr_queries.getEntity(name) is None
+
+
+def test_get_entity_still_finds_entities():
+    assert nfr_queries.getEntity("PerformanceType") is metamodel.PerformanceType
+    assert nfr_queries.getEntity("performance") is metamodel.PerformanceType
+
+
+def test_get_softgoal_class():
+    assert nfr_queries.getSoftgoalClass(metamodel.TimePerformanceType) is metamodel.TimePerformanceSoftgoal
+    assert nfr_queries.getSoftgoalClass(metamodel.NFRSoftgoalType) is None
+    assert nfr_queries.getEntity("softgoal_class_for") is None
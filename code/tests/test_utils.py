@@ -0,0 +1,25 @@
+import nfr_queries
+import utils
+
+
+def test_cached_fuzzy_match_equals_uncached():
+    utils._fuzzy_match_cached.cache_clear()
+    for text in ("Performance", "performnce", "Indexing", "Securty", "zzzzqqqq"):
+        expected = utils._fuzzy_match_cached.__wrapped__(text)
+        assert utils.fuzzy_match_entity(text) == expected
+        assert utils.fuzzy_match_entity(text) == expected  # served from the cache
+
+
+def test_fuzzy_match_error_is_not_cached(monkeypatch):
+    utils._fuzzy_match_cached.cache_clear()
+
+    def broken(name):
+        raise RuntimeError("metamodel not ready")
+
+    monkeypatch.setattr(nfr_queries, "getEntity", broken)
+    matched, message = utils.fuzzy_match_entity("Performance")
+    assert matched is None and "metamodel not ready" in message
+
+    monkeypatch.undo()
+    matched, _ = utils.fuzzy_match_entity("Performance")
+    assert matched == "PerformanceType"
@@ -7,6 +7,7 @@ Shared utility functions used across modules
 import re
 import sys
 import os
+import functools
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, parent_dir)
 
@@ -98,77 +99,84 @@ def fuzzy_match_entity(user_input: str) -> tuple:
     Fuzzy match user input to metamodel entities.
     Returns (matched_entity_name, suggestion_message) or (None, error_message)
     """
+    user_input = user_input.strip()
+    if not user_input:
+        return None, "Please enter an entity name"
     try:
-        from nfr_queries import getEntity, getEntityName
-        import metamodel
-        import inspect
-        
-        user_input = user_input.strip()
-        if not user_input:
-            return None, "Please enter an entity name"
-        
-        # First try exact match via getEntity (which has built-in fuzzy matching)
-        entity = getEntity(user_input)
-        if entity:
-            entity_name = getEntityName(entity)
-            # Check if the input was different from the matched name
-            if user_input.lower() != entity_name.lower().replace('type', '').replace('softgoal', ''):
-                formatted = format_entity_name(entity_name)
-                return entity_name, f"💡 Matched '{user_input}' → {formatted}\n\n"
-            return entity_name, ""
-        
-        # If getEntity failed, try manual fuzzy matching
-        # Collect all entity names
-        all_entities = []
-        for name, obj in inspect.getmembers(metamodel):
-            if inspect.isclass(obj) and not name.startswith('_'):
-                all_entities.append(name)
-        
-        # Find closest matches
-        user_lower = user_input.lower()
-        matches = []
-        for entity_name in all_entities:
-            entity_lower = entity_name.lower()
-            # Calculate distance
-            dist = levenshtein_distance(user_lower, entity_lower)
-            # Also check without common suffixes
-            entity_clean = entity_lower.replace('type', '').replace('softgoal', '')
-            dist_clean = levenshtein_distance(user_lower, entity_clean)
-            min_dist = min(dist, dist_clean)
-            
-            # Accept if distance is reasonable (within 40% of input length)
-            threshold = max(3, len(user_input) * 0.4)
-            if min_dist <= threshold:
-                matches.append((entity_name, min_dist))
-        
-        # Sort by distance, but prefer "Type" suffix over "Softgoal" suffix
-        def sort_key(match):
-            name, dist = match
-            # Prefer Type > Softgoal > Others
-            suffix_priority = 0
-            if name.endswith('Type'):
-                suffix_priority = 0  # Highest priority
-            elif name.endswith('Softgoal'):
-                suffix_priority = 1  # Lower priority
-            else:
-                suffix_priority = 2  # Lowest priority
-            return (suffix_priority, dist)  # Sort by suffix first, then distance
-        
-        matches.sort(key=sort_key)
-        
-        if matches:
-            best_match = matches[0][0]
-            formatted = format_entity_name(best_match)
-            # Show only Type versions in suggestions (filter out Softgoals)
-            type_matches = [m for m in matches if m[0].endswith('Type')]
-            if type_matches:
-                suggestions = [format_entity_name(m[0]) for m in type_matches[:3]]
-            else:
-                suggestions = [format_entity_name(m[0]) for m in matches[:3]]
-            suggestion_msg = f"💡 Did you mean: {', '.join(suggestions)}?\n\n"
-            return best_match, suggestion_msg
-        
-        return None, f"âŒ Could not find entity: {user_input}\n\nTry: Performance, Security, Usability, Indexing, Encryption, etc."
-        
+        return _fuzzy_match_cached(user_input)
     except Exception as e:
-        return None, f"âŒ Error during matching: {str(e)}"
\ No newline at end of file
+        return None, f"âŒ Error during matching: {str(e)}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _fuzzy_match_cached(user_input: str) -> tuple:
+    """
+    Cached worker for fuzzy_match_entity (input is already stripped).
+    Errors propagate, so a failed lookup is never cached.
+    """
+    from nfr_queries import getEntity, getEntityName
+    import metamodel
+    import inspect
+    
+    # First try exact match via getEntity (which has built-in fuzzy matching)
+    entity = getEntity(user_input)
+    if entity:
+        entity_name = getEntityName(entity)
+        # Check if the input was different from the matched name
+        if user_input.lower() != entity_name.lower().replace('type', '').replace('softgoal', ''):
+            formatted = format_entity_name(entity_name)
+            return entity_name, f"💡 Matched '{user_input}' → {formatted}\n\n"
+        return entity_name, ""
+    
+    # If getEntity failed, try manual fuzzy matching
+    # Collect all entity names
+    all_entities = []
+    for name, obj in inspect.getmembers(metamodel):
+        if inspect.isclass(obj) and not name.startswith('_'):
+            all_entities.append(name)
+    
+    # Find closest matches
+    user_lower = user_input.lower()
+    matches = []
+    for entity_name in all_entities:
+        entity_lower = entity_name.lower()
+        # Calculate distance
+        dist = levenshtein_distance(user_lower, entity_lower)
+        # Also check without common suffixes
+        entity_clean = entity_lower.replace('type', '').replace('softgoal', '')
+        dist_clean = levenshtein_distance(user_lower, entity_clean)
+        min_dist = min(dist, dist_clean)
+        
+        # Accept if distance is reasonable (within 40% of input length)
+        threshold = max(3, len(user_input) * 0.4)
+        if min_dist <= threshold:
+            matches.append((entity_name, min_dist))
+    
+    # Sort by distance, but prefer "Type" suffix over "Softgoal" suffix
+    def sort_key(match):
+        name, dist = match
+        # Prefer Type > Softgoal > Others
+        suffix_priority = 0
+        if name.endswith('Type'):
+            suffix_priority = 0  # Highest priority
+        elif name.endswith('Softgoal'):
+            suffix_priority = 1  # Lower priority
+        else:
+            suffix_priority = 2  # Lowest priority
+        return (suffix_priority, dist)  # Sort by suffix first, then distance
+    
+    matches.sort(key=sort_key)
+    
+    if matches:
+        best_match = matches[0][0]
+        formatted = format_entity_name(best_match)
+        # Show only Type versions in suggestions (filter out Softgoals)
+        type_matches = [m for m in matches if m[0].endswith('Type')]
+        if type_matches:
+            suggestions = [format_entity_name(m[0]) for m in type_matches[:3]]
+        else:
+            suggestions = [format_entity_name(m[0]) for m in matches[:3]]
+        suggestion_msg = f"💡 Did you mean: {', '.join(suggestions)}?\n\n"
+        return best_match, suggestion_msg
+    
+    return None, f"âŒ Could not find entity: {user_input}\n\nTry: Performance, Security, Usability, Indexing, Encryption, etc."